@@ -0,0 +1,44 @@
+#!/usr/bin/env python3
+"""Optional ahead-of-time build for the Soorj front end.
+
+Compiles lexer.py and parser.py to C extension modules with mypyc.
+Python prefers the built .so over the .py of the same name, so after
+running this, soorj.py picks up the compiled front end automatically -
+no other changes needed. Delete the generated files to go back to
+pure Python.
+
+Usage:
+    pip install mypy
+    python3 build_native.py
+"""
+
+import sys
+
+# The front end is the best fit for AOT compilation: attribute-heavy,
+# token-at-a-time Python with full type annotations and no dynamic
+# tricks. The tree-walking interpreter and VM stay pure Python - their
+# dispatch tables of bound methods and exec-generated closures are the
+# kind of dynamism mypyc does not speed up.
+MODULES = ["lexer.py", "parser.py"]
+
+
+def main() -> int:
+    try:
+        from mypyc.build import mypycify
+        from setuptools import setup
+    except ImportError:
+        print("mypyc is not installed; the interpreter keeps running "
+              "as pure Python.")
+        print("To build the native front end: pip install mypy setuptools")
+        return 1
+
+    setup(
+        name="soorj-native",
+        ext_modules=mypycify(MODULES),
+        script_args=["build_ext", "--inplace"],
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
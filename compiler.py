@@ -0,0 +1,768 @@
+from typing import Any, Dict, List, Optional, Set
+from parser import (
+    ASTNode, NumberLiteral, StringLiteral, BooleanLiteral, NullLiteral,
+    Identifier, BinaryOp, UnaryOp, Assignment, FunctionCall,
+    ExpressionStatement, IfStatement, WhileStatement, ReturnStatement,
+    FunctionDeclaration, Program
+)
+import opcodes as op
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Built-in functions occupy the first global slots, in this order
+BUILTIN_NAMES = ("գրէ", "թիվ", "բառ")
+
+
+class CodeObject:
+    """Compiled bytecode for a program or a single function body"""
+    def __init__(self, name: str, parameters: List[str],
+                 code: List[int], consts: List[Any],
+                 num_locals: int, local_names: List[str],
+                 global_names: Optional[List[str]] = None):
+        self.name = name
+        self.parameters = parameters
+        self.code = code
+        self.consts = consts
+        self.num_locals = num_locals
+        self.local_names = local_names
+        self.global_names = global_names
+        self.natives: List[Any] = []
+
+
+# AST operator -> opcode
+BINARY_OPS = {
+    '+': op.ADD,
+    '-': op.SUB,
+    '*': op.MUL,
+    '/': op.DIV,
+    '%': op.MOD,
+    '==': op.EQ,
+    '!=': op.NE,
+    '<': op.LT,
+    '>': op.GT,
+    '<=': op.LE,
+    '>=': op.GE,
+    'և': op.BOOL_AND,   # and
+    'կամ': op.BOOL_OR,  # or
+}
+
+UNARY_OPS = {
+    '-': op.NEG,
+    'չի': op.BOOL_NOT,  # not
+}
+
+# Arithmetic/comparison operators with numeric-specialized variants
+NUMERIC_BINARY_OPS = {
+    '+': op.ADD_NUM,
+    '-': op.SUB_NUM,
+    '*': op.MUL_NUM,
+    '/': op.DIV_NUM,
+    '%': op.MOD_NUM,
+    '<': op.LT_NUM,
+    '>': op.GT_NUM,
+    '<=': op.LE_NUM,
+    '>=': op.GE_NUM,
+}
+
+_ARITHMETIC = ('+', '-', '*', '/', '%')
+
+
+class Compiler:
+    """Lowers an AST to a flat list of integer opcodes plus a constants table"""
+    def __init__(self, global_scope: Dict[str, int] = None,
+                 shadowed_builtins: Set[str] = None,
+                 numeric_names: Set[str] = None,
+                 global_bindings: Set[str] = None):
+        self.code: List[int] = []
+        self.consts: List[Any] = []
+        self.const_index = {}
+        # Names the program rebinds; calls to these can't be specialized
+        self.shadowed_builtins = shadowed_builtins if shadowed_builtins is not None else set()
+        # Names bound by top-level code (plus the builtins); the only
+        # names an in-function assignment may target as globals
+        self.global_bindings = global_bindings if global_bindings is not None else set(BUILTIN_NAMES)
+        # name -> slot index; globals are shared across nested compilers,
+        # local_scope is None at top level and a fresh dict per function
+        if global_scope is None:
+            global_scope = {name: slot for slot, name in enumerate(BUILTIN_NAMES)}
+        self.global_scope = global_scope
+        self.local_scope: Optional[Dict[str, int]] = None
+        # Natively compiled loop bodies, indexed by RUN_NATIVE operands
+        self.natives: List[Any] = []
+        # Names that provably only ever hold numbers
+        self.numeric_names = numeric_names if numeric_names is not None else set()
+
+    def compile_program(self, program: Program) -> CodeObject:
+        """Compile a full program to a top-level code object"""
+        self.shadowed_builtins = self.collect_bound_names(program)
+        self.numeric_names = self.infer_numeric_names(program)
+        self.global_bindings = self.collect_global_bindings(program)
+        for statement in program.statements:
+            self.compile_statement(statement)
+        # Every code object ends with an explicit RET so the threaded
+        # dispatch never runs off the end of the opcode list
+        self.emit(op.LOAD_CONST, self.add_const(None))
+        self.emit(op.RET)
+        self.finalize()
+        global_names = [None] * len(self.global_scope)
+        for name, slot in self.global_scope.items():
+            global_names[slot] = name
+        code = CodeObject("<program>", [], self.code, self.consts,
+                          0, [], global_names)
+        code.natives = self.natives
+        return code
+
+    # Name resolution
+
+    def global_slot(self, name: str) -> int:
+        """Slot index for a global, allocated on first reference"""
+        slot = self.global_scope.get(name)
+        if slot is None:
+            slot = len(self.global_scope)
+            self.global_scope[name] = slot
+        return slot
+
+    def resolve_load(self, name: str):
+        """Opcode and slot for reading a name"""
+        if self.local_scope is not None:
+            slot = self.local_scope.get(name)
+            if slot is not None:
+                return op.LOAD_LOCAL, slot
+        return op.LOAD_GLOBAL, self.global_slot(name)
+
+    def resolve_store(self, name: str):
+        """Opcode and slot for writing a name
+
+        Inside a function, an assignment targets an existing local, then a
+        name the top-level code binds (a global), and otherwise defines a
+        new local. Top-level bindings are collected up front, so the
+        choice depends only on the program text - not on the order in
+        which function bodies happen to compile, and not on names that
+        are merely read somewhere.
+        """
+        if self.local_scope is None:
+            return op.STORE_GLOBAL, self.global_slot(name)
+        slot = self.local_scope.get(name)
+        if slot is not None:
+            return op.STORE_LOCAL, slot
+        if name in self.global_bindings:
+            return op.STORE_GLOBAL, self.global_slot(name)
+        slot = len(self.local_scope)
+        self.local_scope[name] = slot
+        return op.STORE_LOCAL, slot
+
+    def infer_numeric_names(self, program: Program) -> Set[str]:
+        """Names whose every assignment in the program is a numeric expression
+
+        Starts from all assigned names and repeatedly drops any name with an
+        assignment that isn't provably numeric, until a fixed point. Function
+        parameters and function names are never considered numeric since
+        their values aren't known at compile time.
+        """
+        assignments = []
+        non_numeric: Set[str] = set()
+        self._scan_assignments(program, assignments, non_numeric)
+        candidates = {target for target, _ in assignments} - non_numeric
+        changed = True
+        while changed:
+            changed = False
+            for target, value in assignments:
+                if target in candidates and not self._is_numeric(value, candidates):
+                    candidates.discard(target)
+                    changed = True
+        return candidates
+
+    def _scan_assignments(self, node: ASTNode, assignments, non_numeric: Set[str]):
+        if isinstance(node, Program):
+            for stmt in node.statements:
+                self._scan_assignments(stmt, assignments, non_numeric)
+        elif isinstance(node, ExpressionStatement):
+            self._scan_assignments(node.expression, assignments, non_numeric)
+        elif isinstance(node, Assignment):
+            assignments.append((node.target, node.value))
+            self._scan_assignments(node.value, assignments, non_numeric)
+        elif isinstance(node, IfStatement):
+            self._scan_assignments(node.condition, assignments, non_numeric)
+            for stmt in node.then_branch:
+                self._scan_assignments(stmt, assignments, non_numeric)
+            for stmt in node.else_branch or []:
+                self._scan_assignments(stmt, assignments, non_numeric)
+        elif isinstance(node, WhileStatement):
+            self._scan_assignments(node.condition, assignments, non_numeric)
+            for stmt in node.body:
+                self._scan_assignments(stmt, assignments, non_numeric)
+        elif isinstance(node, ReturnStatement):
+            if node.value:
+                self._scan_assignments(node.value, assignments, non_numeric)
+        elif isinstance(node, FunctionDeclaration):
+            non_numeric.add(node.name)
+            non_numeric.update(node.parameters)
+            for stmt in node.body:
+                self._scan_assignments(stmt, assignments, non_numeric)
+        elif isinstance(node, BinaryOp):
+            self._scan_assignments(node.left, assignments, non_numeric)
+            self._scan_assignments(node.right, assignments, non_numeric)
+        elif isinstance(node, UnaryOp):
+            self._scan_assignments(node.operand, assignments, non_numeric)
+        elif isinstance(node, FunctionCall):
+            for argument in node.arguments:
+                self._scan_assignments(argument, assignments, non_numeric)
+
+    def _is_numeric(self, node: ASTNode, numeric_names: Set[str]) -> bool:
+        if isinstance(node, NumberLiteral):
+            return True
+        if isinstance(node, Identifier):
+            return node.name in numeric_names
+        if isinstance(node, UnaryOp):
+            return node.operator == '-' and self._is_numeric(node.operand, numeric_names)
+        if isinstance(node, BinaryOp):
+            return (node.operator in _ARITHMETIC and
+                    self._is_numeric(node.left, numeric_names) and
+                    self._is_numeric(node.right, numeric_names))
+        if isinstance(node, Assignment):
+            return self._is_numeric(node.value, numeric_names)
+        return False
+
+    def is_numeric_expression(self, node: ASTNode) -> bool:
+        """True if the expression provably evaluates to a number"""
+        return self._is_numeric(node, self.numeric_names)
+
+    def collect_bound_names(self, node: ASTNode) -> Set[str]:
+        """Collect every name the program assigns or declares"""
+        names: Set[str] = set()
+        self._scan_bindings(node, names)
+        return names
+
+    def _scan_bindings(self, node: ASTNode, names: Set[str]):
+        if isinstance(node, Program):
+            for stmt in node.statements:
+                self._scan_bindings(stmt, names)
+        elif isinstance(node, ExpressionStatement):
+            self._scan_bindings(node.expression, names)
+        elif isinstance(node, Assignment):
+            names.add(node.target)
+            self._scan_bindings(node.value, names)
+        elif isinstance(node, IfStatement):
+            self._scan_bindings(node.condition, names)
+            for stmt in node.then_branch:
+                self._scan_bindings(stmt, names)
+            for stmt in node.else_branch or []:
+                self._scan_bindings(stmt, names)
+        elif isinstance(node, WhileStatement):
+            self._scan_bindings(node.condition, names)
+            for stmt in node.body:
+                self._scan_bindings(stmt, names)
+        elif isinstance(node, ReturnStatement):
+            if node.value:
+                self._scan_bindings(node.value, names)
+        elif isinstance(node, FunctionDeclaration):
+            names.add(node.name)
+            names.update(node.parameters)
+            for stmt in node.body:
+                self._scan_bindings(stmt, names)
+        elif isinstance(node, BinaryOp):
+            self._scan_bindings(node.left, names)
+            self._scan_bindings(node.right, names)
+        elif isinstance(node, UnaryOp):
+            self._scan_bindings(node.operand, names)
+        elif isinstance(node, FunctionCall):
+            for argument in node.arguments:
+                self._scan_bindings(argument, names)
+
+    def collect_global_bindings(self, program: Program) -> Set[str]:
+        """Names bound by top-level code, including inside if/while blocks
+
+        Function bodies are not entered: a declaration binds the function's
+        name at the top level, but the assignments inside it bind locals
+        unless the name is also bound out here.
+        """
+        names: Set[str] = set(BUILTIN_NAMES)
+        self._scan_global_bindings(program, names)
+        return names
+
+    def _scan_global_bindings(self, node: ASTNode, names: Set[str]):
+        if isinstance(node, Program):
+            for stmt in node.statements:
+                self._scan_global_bindings(stmt, names)
+        elif isinstance(node, ExpressionStatement):
+            self._scan_global_bindings(node.expression, names)
+        elif isinstance(node, Assignment):
+            names.add(node.target)
+            self._scan_global_bindings(node.value, names)
+        elif isinstance(node, IfStatement):
+            self._scan_global_bindings(node.condition, names)
+            for stmt in node.then_branch:
+                self._scan_global_bindings(stmt, names)
+            for stmt in node.else_branch or []:
+                self._scan_global_bindings(stmt, names)
+        elif isinstance(node, WhileStatement):
+            self._scan_global_bindings(node.condition, names)
+            for stmt in node.body:
+                self._scan_global_bindings(stmt, names)
+        elif isinstance(node, ReturnStatement):
+            if node.value:
+                self._scan_global_bindings(node.value, names)
+        elif isinstance(node, FunctionDeclaration):
+            names.add(node.name)
+        elif isinstance(node, BinaryOp):
+            self._scan_global_bindings(node.left, names)
+            self._scan_global_bindings(node.right, names)
+        elif isinstance(node, UnaryOp):
+            self._scan_global_bindings(node.operand, names)
+        elif isinstance(node, FunctionCall):
+            for argument in node.arguments:
+                self._scan_global_bindings(argument, names)
+
+    # Emission helpers
+
+    def emit(self, *codes: int):
+        self.code.extend(codes)
+
+    def add_const(self, value: Any) -> int:
+        # Key on type as well so e.g. True and 1.0 don't collide
+        try:
+            key = (type(value), value)
+            index = self.const_index.get(key)
+        except TypeError:
+            key = None
+            index = None
+        if index is not None:
+            return index
+        index = len(self.consts)
+        self.consts.append(value)
+        if key is not None:
+            self.const_index[key] = index
+        return index
+
+    def finalize(self):
+        """Peephole pass: fuse hot opcode sequences into superinstructions
+
+        Rewrites the loop-condition pattern
+        [LOAD_* s, LOAD_CONST k, LT_NUM, JUMP_IF_FALSE t] into one
+        LT_*_CONST_JF instruction, and the counter pattern
+        [LOAD_* s, LOAD_CONST 1, ADD_NUM, STORE_* s] into INC_*,
+        collapsing four dispatches into one per loop iteration.
+        """
+        # Decode the flat code into (opcode, [args]) instructions and turn
+        # jump targets from code offsets into instruction indices
+        instructions = []
+        offset_to_index = {}
+        pc = 0
+        code = self.code
+        while pc < len(code):
+            opcode = code[pc]
+            arity = op.ARITY.get(opcode, 0)
+            offset_to_index[pc] = len(instructions)
+            instructions.append([opcode, list(code[pc + 1:pc + 1 + arity])])
+            pc += 1 + arity
+        offset_to_index[len(code)] = len(instructions)
+
+        targets = set()
+        for opcode, args in instructions:
+            jump_arg = op.JUMP_OPERANDS.get(opcode)
+            if jump_arg is not None:
+                args[jump_arg] = offset_to_index[args[jump_arg]]
+                targets.add(args[jump_arg])
+
+        # Fuse patterns, tracking how instruction indices move
+        fused = []
+        index_map = {}
+        i = 0
+        while i < len(instructions):
+            index_map[i] = len(fused)
+            replacement = self._match_superinstruction(instructions, i, targets)
+            if replacement is not None:
+                instruction, length = replacement
+                for j in range(i, i + length):
+                    index_map[j] = len(fused)
+                fused.append(instruction)
+                i += length
+            else:
+                fused.append(instructions[i])
+                i += 1
+        index_map[len(instructions)] = len(fused)
+
+        # Re-encode, remapping jump targets to the new offsets
+        offsets = []
+        total = 0
+        for opcode, args in fused:
+            offsets.append(total)
+            total += 1 + len(args)
+        offsets.append(total)
+
+        new_code = []
+        for opcode, args in fused:
+            jump_arg = op.JUMP_OPERANDS.get(opcode)
+            if jump_arg is not None:
+                args[jump_arg] = offsets[index_map[args[jump_arg]]]
+            new_code.append(opcode)
+            new_code.extend(args)
+        self.code = new_code
+
+    def _match_superinstruction(self, instructions, i, targets):
+        """Try to fuse the pattern starting at instruction i"""
+        if i + 4 > len(instructions):
+            return None
+        # Jumps into the middle of a fused sequence would be lost
+        if any(j in targets for j in range(i + 1, i + 4)):
+            return None
+        (op1, args1), (op2, args2), (op3, args3), (op4, args4) = instructions[i:i + 4]
+        if op2 != op.LOAD_CONST:
+            return None
+
+        if op3 == op.LT_NUM and op4 == op.JUMP_IF_FALSE:
+            if op1 == op.LOAD_LOCAL:
+                return [op.LT_LOCAL_CONST_JF, [args1[0], args2[0], args4[0]]], 4
+            if op1 == op.LOAD_GLOBAL:
+                return [op.LT_GLOBAL_CONST_JF, [args1[0], args2[0], args4[0]]], 4
+
+        if op3 == op.ADD_NUM and self.consts[args2[0]] == 1:
+            if (op1 == op.LOAD_LOCAL and op4 == op.STORE_LOCAL and
+                    args1[0] == args4[0]):
+                return [op.INC_LOCAL, [args1[0]]], 4
+            if (op1 == op.LOAD_GLOBAL and op4 == op.STORE_GLOBAL and
+                    args1[0] == args4[0]):
+                return [op.INC_GLOBAL, [args1[0]]], 4
+
+        return None
+
+    def emit_jump(self, jump_op: int) -> int:
+        """Emit a jump with a placeholder target; returns the operand position"""
+        self.emit(jump_op, 0)
+        return len(self.code) - 1
+
+    def patch_jump(self, operand_pos: int):
+        """Point a previously emitted jump at the current position"""
+        self.code[operand_pos] = len(self.code)
+
+    # Statements
+
+    def compile_statement(self, node: ASTNode):
+        if isinstance(node, ExpressionStatement):
+            self.compile_expression(node.expression)
+            self.emit(op.POP)
+
+        elif isinstance(node, Assignment):
+            # Statement form doesn't need the value left on the stack
+            self.compile_expression(node.value)
+            self.emit(*self.resolve_store(node.target))
+
+        elif isinstance(node, FunctionCall):
+            self.compile_expression(node)
+            self.emit(op.POP)
+
+        elif isinstance(node, IfStatement):
+            self.compile_expression(node.condition)
+            else_jump = self.emit_jump(op.JUMP_IF_FALSE)
+            for stmt in node.then_branch:
+                self.compile_statement(stmt)
+            if node.else_branch:
+                end_jump = self.emit_jump(op.JUMP)
+                self.patch_jump(else_jump)
+                for stmt in node.else_branch:
+                    self.compile_statement(stmt)
+                self.patch_jump(end_jump)
+            else:
+                self.patch_jump(else_jump)
+
+        elif isinstance(node, WhileStatement):
+            native_index = self.try_codegen_while(node)
+            if native_index is not None:
+                self.emit(op.RUN_NATIVE, native_index)
+                return
+            loop_start = len(self.code)
+            self.compile_expression(node.condition)
+            exit_jump = self.emit_jump(op.JUMP_IF_FALSE)
+            for stmt in node.body:
+                self.compile_statement(stmt)
+            self.emit(op.JUMP, loop_start)
+            self.patch_jump(exit_jump)
+
+        elif isinstance(node, ReturnStatement):
+            if node.value:
+                self.compile_expression(node.value)
+            else:
+                self.emit(op.LOAD_CONST, self.add_const(None))
+            self.emit(op.RET)
+
+        elif isinstance(node, FunctionDeclaration):
+            # Bind the name before compiling the body so recursion resolves
+            store_op, slot = self.resolve_store(node.name)
+            function_code = self.compile_function(node)
+            self.emit(op.LOAD_CONST, self.add_const(function_code))
+            self.emit(store_op, slot)
+
+        else:
+            raise RuntimeError(f"Cannot compile statement: {type(node)}")
+
+    def compile_function(self, node: FunctionDeclaration) -> CodeObject:
+        """Compile a function body into its own code object"""
+        compiler = Compiler(self.global_scope, self.shadowed_builtins,
+                            self.numeric_names, self.global_bindings)
+        compiler.local_scope = {param: slot for slot, param in enumerate(node.parameters)}
+        for stmt in node.body:
+            compiler.compile_statement(stmt)
+        # Implicit "return null" at the end of every function
+        compiler.emit(op.LOAD_CONST, compiler.add_const(None))
+        compiler.emit(op.RET)
+        compiler.finalize()
+        local_names = [None] * len(compiler.local_scope)
+        for name, slot in compiler.local_scope.items():
+            local_names[slot] = name
+        code = CodeObject(node.name, node.parameters, compiler.code,
+                          compiler.consts, len(local_names), local_names)
+        code.natives = compiler.natives
+        return code
+
+    # Native loop codegen
+
+    def try_codegen_while(self, node: WhileStatement) -> Optional[int]:
+        """Compile an all-numeric while loop to a native Python closure
+
+        When the condition and every body statement only touch
+        proven-numeric names from one storage (a function's locals, or the
+        globals at top level), generate equivalent Python source operating
+        directly on the slot list and run it in one shot - the loop then
+        pays no bytecode dispatch at all. Returns the natives-table index,
+        or None when any construct falls outside the numeric subset.
+        """
+        condition_src = self._native_expr(node.condition)
+        if condition_src is None:
+            return None
+        # Names the loop reads before writing, in evaluation order: the
+        # generated code compares raw slot values, so an unset slot must
+        # be caught up front with the VM's own undefined-variable error
+        # rather than surfacing as a TypeError on the sentinel
+        condition_reads: List[str] = []
+        self._collect_entry_reads(node.condition, set(), condition_reads)
+        entry_reads: List[str] = []
+        written = set(condition_reads)
+        body_lines = []
+        for stmt in node.body:
+            if not isinstance(stmt, Assignment):
+                return None
+            assignment = stmt
+            slot = self._native_slot(assignment.target)
+            value_src = self._native_expr(assignment.value)
+            if slot is None or value_src is None:
+                return None
+            self._collect_entry_reads(assignment.value, written, entry_reads)
+            written.add(assignment.target)
+            body_lines.append(f"        L[{slot}] = {value_src}")
+        if not body_lines:
+            return None
+
+        source = (f"def _cond(L):\n    return {condition_src}\n"
+                  f"def _loop(L):\n    while {condition_src}:\n"
+                  + "\n".join(body_lines))
+        namespace = {}
+        exec(compile(source, "<soorj-native-loop>", "exec"), namespace)
+        function = namespace["_loop"]
+        if numba is not None:
+            function = self._wrap_numba(function)
+        if condition_reads or entry_reads:
+            function = self._guard_undefined(
+                function, namespace["_cond"],
+                [(self._native_slot(name), name) for name in condition_reads],
+                [(self._native_slot(name), name) for name in entry_reads],
+            )
+        self.natives.append(function)
+        return len(self.natives) - 1
+
+    def _collect_entry_reads(self, node: ASTNode, written: Set[str],
+                             out: List[str]):
+        """Append names node reads, in evaluation order, skipping names in
+        written and names already collected"""
+        if isinstance(node, Identifier):
+            if node.name not in written and node.name not in out:
+                out.append(node.name)
+        elif isinstance(node, UnaryOp):
+            self._collect_entry_reads(node.operand, written, out)
+        elif isinstance(node, BinaryOp):
+            self._collect_entry_reads(node.left, written, out)
+            self._collect_entry_reads(node.right, written, out)
+
+    @staticmethod
+    def _guard_undefined(function, condition, condition_checks, body_checks):
+        """Refuse to enter a native loop with an unset slot
+
+        Condition slots are read unconditionally, so they're always
+        checked; body slots are only read once the condition holds, so
+        they're checked behind one extra condition evaluation - exactly
+        when the first bytecode iteration would have read them.
+        """
+        def runner(slots):
+            for slot, name in condition_checks:
+                if slots[slot] is op.UNDEFINED:
+                    raise RuntimeError(f"Undefined variable '{name}'")
+            if body_checks and condition(slots):
+                for slot, name in body_checks:
+                    if slots[slot] is op.UNDEFINED:
+                        raise RuntimeError(f"Undefined variable '{name}'")
+            return function(slots)
+
+        return runner
+
+    @staticmethod
+    def _wrap_numba(function):
+        """JIT the loop with numba, falling back if compilation fails"""
+        jitted = numba.njit(function)
+
+        def runner(slots):
+            try:
+                return jitted(slots)
+            except Exception:
+                return function(slots)
+
+        return runner
+
+    def _native_slot(self, name: str) -> Optional[int]:
+        """Slot index for a numeric name in the loop's storage, or None"""
+        if name not in self.numeric_names:
+            return None
+        if self.local_scope is not None:
+            return self.local_scope.get(name)
+        return self.global_scope.get(name)
+
+    def _native_expr(self, node: ASTNode) -> Optional[str]:
+        """Python source for an expression over numeric slots, or None"""
+        if isinstance(node, NumberLiteral):
+            return repr(node.value)
+        if isinstance(node, Identifier):
+            slot = self._native_slot(node.name)
+            if slot is None:
+                return None
+            return f"L[{slot}]"
+        if isinstance(node, UnaryOp):
+            if node.operator != '-':
+                return None
+            operand = self._native_expr(node.operand)
+            return None if operand is None else f"(-{operand})"
+        if isinstance(node, BinaryOp):
+            left = self._native_expr(node.left)
+            right = self._native_expr(node.right)
+            if left is None or right is None:
+                return None
+            operator = node.operator
+            # Division is excluded so a zero divisor still raises the
+            # interpreter's own error through the bytecode path
+            if operator in ('+', '-', '*', '%', '<', '>', '<=', '>=', '==', '!='):
+                return f"({left} {operator} {right})"
+            if operator == 'և':
+                return f"(bool({left}) and bool({right}))"
+            if operator == 'կամ':
+                return f"(bool({left}) or bool({right}))"
+            return None
+        return None
+
+    # Expressions
+
+    def fold(self, node: ASTNode) -> ASTNode:
+        """Collapse literal-only subtrees into a single literal, bottom-up.
+
+        Work the runtime would redo on every evaluation - 2 * 3, -1,
+        "ա" + "բ", 3 < 5 - is done once here instead.
+        """
+        if type(node) is BinaryOp:
+            left = self.fold(node.left)
+            right = self.fold(node.right)
+            operator = node.operator
+            if type(left) is NumberLiteral and type(right) is NumberLiteral:
+                l, r = left.value, right.value
+                if operator == "+":
+                    return NumberLiteral(l + r)
+                if operator == "-":
+                    return NumberLiteral(l - r)
+                if operator == "*":
+                    return NumberLiteral(l * r)
+                if operator == "/" and r != 0:
+                    return NumberLiteral(l / r)
+                if operator == "%" and r != 0:
+                    return NumberLiteral(l % r)
+                if operator == "==":
+                    return BooleanLiteral(l == r)
+                if operator == "!=":
+                    return BooleanLiteral(l != r)
+                if operator == "<":
+                    return BooleanLiteral(l < r)
+                if operator == ">":
+                    return BooleanLiteral(l > r)
+                if operator == "<=":
+                    return BooleanLiteral(l <= r)
+                if operator == ">=":
+                    return BooleanLiteral(l >= r)
+            elif (operator == "+" and type(left) is StringLiteral and
+                    type(right) is StringLiteral):
+                return StringLiteral(left.value + right.value)
+            node.left = left
+            node.right = right
+            return node
+        if type(node) is UnaryOp:
+            operand = self.fold(node.operand)
+            if node.operator == "-" and type(operand) is NumberLiteral:
+                return NumberLiteral(-operand.value)
+            node.operand = operand
+            return node
+        return node
+
+    def compile_expression(self, node: ASTNode):
+        if isinstance(node, (BinaryOp, UnaryOp)):
+            node = self.fold(node)
+
+        if isinstance(node, NumberLiteral):
+            self.emit(op.LOAD_CONST, self.add_const(node.value))
+
+        elif isinstance(node, StringLiteral):
+            self.emit(op.LOAD_CONST, self.add_const(node.value))
+
+        elif isinstance(node, BooleanLiteral):
+            self.emit(op.LOAD_CONST, self.add_const(node.value))
+
+        elif isinstance(node, NullLiteral):
+            self.emit(op.LOAD_CONST, self.add_const(None))
+
+        elif isinstance(node, Identifier):
+            self.emit(*self.resolve_load(node.name))
+
+        elif isinstance(node, Assignment):
+            self.compile_expression(node.value)
+            self.emit(op.DUP)
+            self.emit(*self.resolve_store(node.target))
+
+        elif isinstance(node, BinaryOp):
+            self.compile_expression(node.left)
+            self.compile_expression(node.right)
+            if (node.operator in NUMERIC_BINARY_OPS and
+                    self.is_numeric_expression(node.left) and
+                    self.is_numeric_expression(node.right)):
+                self.emit(NUMERIC_BINARY_OPS[node.operator])
+            else:
+                opcode = BINARY_OPS.get(node.operator)
+                if opcode is None:
+                    raise RuntimeError(f"Unknown binary operator: {node.operator}")
+                self.emit(opcode)
+
+        elif isinstance(node, UnaryOp):
+            self.compile_expression(node.operand)
+            opcode = UNARY_OPS.get(node.operator)
+            if opcode is None:
+                raise RuntimeError(f"Unknown unary operator: {node.operator}")
+            self.emit(opcode)
+
+        elif isinstance(node, FunctionCall):
+            if node.name == "գրէ" and node.name not in self.shadowed_builtins:
+                # Direct print, no name lookup at runtime
+                for argument in node.arguments:
+                    self.compile_expression(argument)
+                self.emit(op.PRINT, len(node.arguments))
+            else:
+                self.emit(*self.resolve_load(node.name))
+                for argument in node.arguments:
+                    self.compile_expression(argument)
+                self.emit(op.CALL, len(node.arguments), self.add_const(node.name))
+
+        else:
+            raise RuntimeError(f"Cannot compile expression: {type(node)}")
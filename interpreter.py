@@ -9,6 +9,8 @@ from parser import (
 
 class SoorjValue:
     """Represents a value in the Soorj language"""
+    __slots__ = ('value', 'type_name')
+
     def __init__(self, value: Any, type_name: str):
         self.value = value
         self.type_name = type_name
@@ -36,6 +38,13 @@ class SoorjValue:
         return True
 
 
+# Interned singletons for the three immutable values; evaluating them never
+# needs a fresh allocation
+NULL_VALUE = SoorjValue(None, "null")
+TRUE_VALUE = SoorjValue(True, "boolean")
+FALSE_VALUE = SoorjValue(False, "boolean")
+
+
 class ReturnValue(Exception):
     """Exception used to handle return statements"""
     def __init__(self, value: SoorjValue):
@@ -44,6 +53,8 @@ class ReturnValue(Exception):
 
 class SoorjFunction:
     """Represents a user-defined function"""
+    __slots__ = ('name', 'parameters', 'body')
+
     def __init__(self, name: str, parameters: List[str], body: List[ASTNode]):
         self.name = name
         self.parameters = parameters
@@ -67,7 +78,7 @@ class SoorjFunction:
                 interpreter.execute(stmt)
             
             # If no return statement, return null
-            return SoorjValue(None, "null")
+            return NULL_VALUE
         
         except ReturnValue as ret:
             return ret.value
@@ -79,6 +90,8 @@ class SoorjFunction:
 
 class BuiltinFunction:
     """Represents a built-in function"""
+    __slots__ = ('name', 'func')
+
     def __init__(self, name: str, func: Callable):
         self.name = name
         self.func = func
@@ -88,35 +101,91 @@ class BuiltinFunction:
 
 
 class Environment:
-    """Environment for variable and function storage"""
+    """Environment for variable and function storage
+
+    Scoping is flat: a frame's own variables, then the globals. If/while
+    bodies share their enclosing frame, so the only frames are the global
+    environment and one per active function call - no parent-chain walk.
+    """
+    __slots__ = ('globals_env', 'variables', 'version')
+
     def __init__(self, parent: Optional['Environment'] = None):
-        self.parent = parent
+        self.globals_env = parent.globals_env if parent else self
         self.variables: Dict[str, SoorjValue] = {}
+        # Bumped whenever a function binding changes, to invalidate
+        # call sites that cached their resolved callee
+        self.version = 0
     
     def define(self, name: str, value: SoorjValue):
+        if value.type_name == "function":
+            self.globals_env.version += 1
         self.variables[name] = value
     
     def get(self, name: str) -> SoorjValue:
         if name in self.variables:
             return self.variables[name]
-        elif self.parent:
-            return self.parent.get(name)
-        else:
-            raise RuntimeError(f"Undefined variable '{name}'")
+        global_vars = self.globals_env.variables
+        if name in global_vars:
+            return global_vars[name]
+        raise RuntimeError(f"Undefined variable '{name}'")
     
     def assign(self, name: str, value: SoorjValue):
         if name in self.variables:
+            if (value.type_name == "function" or
+                    self.variables[name].type_name == "function"):
+                self.globals_env.version += 1
             self.variables[name] = value
-        elif self.parent:
-            self.parent.assign(name, value)
-        else:
-            raise RuntimeError(f"Undefined variable '{name}'")
+            return
+        global_vars = self.globals_env.variables
+        if name in global_vars:
+            if (value.type_name == "function" or
+                    global_vars[name].type_name == "function"):
+                self.globals_env.version += 1
+            global_vars[name] = value
+            return
+        raise RuntimeError(f"Undefined variable '{name}'")
 
 
 class Interpreter:
     def __init__(self):
         self.environment = Environment()
         self.setup_builtins()
+        # type(node) -> handler; one C-level dict lookup instead of an
+        # isinstance chain per node
+        self._exec = {
+            Program: self._exec_program,
+            ExpressionStatement: self._exec_expression_statement,
+            IfStatement: self._exec_if,
+            WhileStatement: self._exec_while,
+            ReturnStatement: self._exec_return,
+            FunctionDeclaration: self._exec_function_declaration,
+        }
+        self._eval = {
+            NumberLiteral: self._eval_number,
+            StringLiteral: self._eval_string,
+            BooleanLiteral: self._eval_boolean,
+            NullLiteral: self._eval_null,
+            Identifier: self._eval_identifier,
+            Assignment: self._eval_assignment,
+            BinaryOp: self.evaluate_binary_op,
+            UnaryOp: self.evaluate_unary_op,
+            FunctionCall: self.evaluate_function_call,
+        }
+        self._binops = {
+            "+": self._add,
+            "-": self._subtract,
+            "*": self._multiply,
+            "/": self._divide,
+            "%": self._modulo,
+            "==": self._equals,
+            "!=": self._not_equals,
+            "<": self._less_than,
+            ">": self._greater_than,
+            "<=": self._less_equal,
+            ">=": self._greater_equal,
+            "և": self._logical_and,   # and
+            "կամ": self._logical_or,  # or
+        }
     
     def setup_builtins(self):
         """Set up built-in functions"""
@@ -127,7 +196,7 @@ class Interpreter:
             else:
                 output = " ".join(str(arg) for arg in args)
                 print(output)
-            return SoorjValue(None, "null")
+            return NULL_VALUE
         
         def builtin_tiv(args: List[SoorjValue]) -> SoorjValue:
             """թիվ (number) - converts to number"""
@@ -178,162 +247,164 @@ class Interpreter:
     
     def execute(self, node: ASTNode) -> Optional[SoorjValue]:
         """Execute an AST node"""
-        if isinstance(node, Program):
-            for stmt in node.statements:
+        handler = self._exec.get(type(node))
+        if handler is not None:
+            return handler(node)
+        return self.evaluate(node)
+
+    def _exec_program(self, node: Program) -> None:
+        for stmt in node.statements:
+            self.execute(stmt)
+        return None
+
+    def _exec_expression_statement(self, node: ExpressionStatement) -> SoorjValue:
+        return self.evaluate(node.expression)
+
+    def _exec_if(self, node: IfStatement) -> None:
+        condition = self.evaluate(node.condition)
+        if condition.is_truthy():
+            for stmt in node.then_branch:
                 self.execute(stmt)
-            return None
-        
-        elif isinstance(node, ExpressionStatement):
-            return self.evaluate(node.expression)
-        
-        elif isinstance(node, IfStatement):
+        elif node.else_branch:
+            for stmt in node.else_branch:
+                self.execute(stmt)
+        return None
+
+    def _exec_while(self, node: WhileStatement) -> None:
+        while True:
             condition = self.evaluate(node.condition)
-            if condition.is_truthy():
-                for stmt in node.then_branch:
-                    self.execute(stmt)
-            elif node.else_branch:
-                for stmt in node.else_branch:
-                    self.execute(stmt)
-            return None
-        
-        elif isinstance(node, WhileStatement):
-            while True:
-                condition = self.evaluate(node.condition)
-                if not condition.is_truthy():
-                    break
-                for stmt in node.body:
-                    self.execute(stmt)
-            return None
-        
-        elif isinstance(node, ReturnStatement):
-            value = SoorjValue(None, "null")
-            if node.value:
-                value = self.evaluate(node.value)
-            raise ReturnValue(value)
-        
-        elif isinstance(node, FunctionDeclaration):
-            func = SoorjFunction(node.name, node.parameters, node.body)
-            self.environment.define(node.name, SoorjValue(func, "function"))
-            return None
-        
-        else:
-            return self.evaluate(node)
-    
+            if not condition.is_truthy():
+                break
+            for stmt in node.body:
+                self.execute(stmt)
+        return None
+
+    def _exec_return(self, node: ReturnStatement):
+        value = NULL_VALUE
+        if node.value:
+            value = self.evaluate(node.value)
+        raise ReturnValue(value)
+
+    def _exec_function_declaration(self, node: FunctionDeclaration) -> None:
+        func = SoorjFunction(node.name, node.parameters, node.body)
+        self.environment.define(node.name, SoorjValue(func, "function"))
+        return None
+
     def evaluate(self, node: ASTNode) -> SoorjValue:
         """Evaluate an expression node"""
-        if isinstance(node, NumberLiteral):
-            return SoorjValue(node.value, "number")
-        
-        elif isinstance(node, StringLiteral):
-            return SoorjValue(node.value, "string")
-        
-        elif isinstance(node, BooleanLiteral):
-            return SoorjValue(node.value, "boolean")
-        
-        elif isinstance(node, NullLiteral):
-            return SoorjValue(None, "null")
-        
-        elif isinstance(node, Identifier):
-            return self.environment.get(node.name)
-        
-        elif isinstance(node, Assignment):
-            value = self.evaluate(node.value)
-            try:
-                self.environment.assign(node.target, value)
-            except RuntimeError:
-                # If variable doesn't exist, define it
-                self.environment.define(node.target, value)
-            return value
-        
-        elif isinstance(node, BinaryOp):
-            return self.evaluate_binary_op(node)
-        
-        elif isinstance(node, UnaryOp):
-            return self.evaluate_unary_op(node)
-        
-        elif isinstance(node, FunctionCall):
-            return self.evaluate_function_call(node)
-        
-        else:
+        handler = self._eval.get(type(node))
+        if handler is None:
             raise RuntimeError(f"Unknown node type: {type(node)}")
-    
+        return handler(node)
+
+    def _eval_number(self, node: NumberLiteral) -> SoorjValue:
+        value = node._soorj_value
+        if value is None:
+            value = SoorjValue(node.value, "number")
+            node._soorj_value = value
+        return value
+
+    def _eval_string(self, node: StringLiteral) -> SoorjValue:
+        value = node._soorj_value
+        if value is None:
+            value = SoorjValue(node.value, "string")
+            node._soorj_value = value
+        return value
+
+    def _eval_boolean(self, node: BooleanLiteral) -> SoorjValue:
+        return TRUE_VALUE if node.value else FALSE_VALUE
+
+    def _eval_null(self, node: NullLiteral) -> SoorjValue:
+        return NULL_VALUE
+
+    def _eval_identifier(self, node: Identifier) -> SoorjValue:
+        return self.environment.get(node.name)
+
+    def _eval_assignment(self, node: Assignment) -> SoorjValue:
+        value = self.evaluate(node.value)
+        try:
+            self.environment.assign(node.target, value)
+        except RuntimeError:
+            # If variable doesn't exist, define it
+            self.environment.define(node.target, value)
+        return value
+
     def evaluate_binary_op(self, node: BinaryOp) -> SoorjValue:
         """Evaluate binary operations"""
-        left = self.evaluate(node.left)
-        right = self.evaluate(node.right)
-        
-        if node.operator == "+":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value + right.value, "number")
-            elif left.type_name == "string" or right.type_name == "string":
-                return SoorjValue(str(left.value) + str(right.value), "string")
-            else:
-                raise RuntimeError("Invalid operands for +")
-        
-        elif node.operator == "-":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value - right.value, "number")
-            else:
-                raise RuntimeError("Invalid operands for -")
-        
-        elif node.operator == "*":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value * right.value, "number")
-            else:
-                raise RuntimeError("Invalid operands for *")
-        
-        elif node.operator == "/":
-            if left.type_name == "number" and right.type_name == "number":
-                if right.value == 0:
-                    raise RuntimeError("Division by zero")
-                return SoorjValue(left.value / right.value, "number")
-            else:
-                raise RuntimeError("Invalid operands for /")
-        
-        elif node.operator == "%":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value % right.value, "number")
-            else:
-                raise RuntimeError("Invalid operands for %")
-        
-        elif node.operator == "==":
-            return SoorjValue(left.value == right.value, "boolean")
-        
-        elif node.operator == "!=":
-            return SoorjValue(left.value != right.value, "boolean")
-        
-        elif node.operator == "<":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value < right.value, "boolean")
-            else:
-                raise RuntimeError("Invalid operands for <")
-        
-        elif node.operator == ">":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value > right.value, "boolean")
-            else:
-                raise RuntimeError("Invalid operands for >")
-        
-        elif node.operator == "<=":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value <= right.value, "boolean")
-            else:
-                raise RuntimeError("Invalid operands for <=")
-        
-        elif node.operator == ">=":
-            if left.type_name == "number" and right.type_name == "number":
-                return SoorjValue(left.value >= right.value, "boolean")
-            else:
-                raise RuntimeError("Invalid operands for >=")
-        
-        elif node.operator in ["և"]:  # և (and)
-            return SoorjValue(left.is_truthy() and right.is_truthy(), "boolean")
-        
-        elif node.operator in ["կամ"]:  # կամ (or)
-            return SoorjValue(left.is_truthy() or right.is_truthy(), "boolean")
-        
-        else:
+        handler = self._binops.get(node.operator)
+        if handler is None:
             raise RuntimeError(f"Unknown binary operator: {node.operator}")
+        return handler(self.evaluate(node.left), self.evaluate(node.right))
+
+    def _add(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return SoorjValue(left.value + right.value, "number")
+        elif left.type_name == "string" or right.type_name == "string":
+            return SoorjValue(str(left.value) + str(right.value), "string")
+        else:
+            raise RuntimeError("Invalid operands for +")
+
+    def _subtract(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return SoorjValue(left.value - right.value, "number")
+        else:
+            raise RuntimeError("Invalid operands for -")
+
+    def _multiply(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return SoorjValue(left.value * right.value, "number")
+        else:
+            raise RuntimeError("Invalid operands for *")
+
+    def _divide(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            if right.value == 0:
+                raise RuntimeError("Division by zero")
+            return SoorjValue(left.value / right.value, "number")
+        else:
+            raise RuntimeError("Invalid operands for /")
+
+    def _modulo(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return SoorjValue(left.value % right.value, "number")
+        else:
+            raise RuntimeError("Invalid operands for %")
+
+    def _equals(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        return TRUE_VALUE if left.value == right.value else FALSE_VALUE
+
+    def _not_equals(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        return TRUE_VALUE if left.value != right.value else FALSE_VALUE
+
+    def _less_than(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return TRUE_VALUE if left.value < right.value else FALSE_VALUE
+        else:
+            raise RuntimeError("Invalid operands for <")
+
+    def _greater_than(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return TRUE_VALUE if left.value > right.value else FALSE_VALUE
+        else:
+            raise RuntimeError("Invalid operands for >")
+
+    def _less_equal(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return TRUE_VALUE if left.value <= right.value else FALSE_VALUE
+        else:
+            raise RuntimeError("Invalid operands for <=")
+
+    def _greater_equal(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        if left.type_name == "number" and right.type_name == "number":
+            return TRUE_VALUE if left.value >= right.value else FALSE_VALUE
+        else:
+            raise RuntimeError("Invalid operands for >=")
+
+    def _logical_and(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        return TRUE_VALUE if left.is_truthy() and right.is_truthy() else FALSE_VALUE
+
+    def _logical_or(self, left: SoorjValue, right: SoorjValue) -> SoorjValue:
+        return TRUE_VALUE if left.is_truthy() or right.is_truthy() else FALSE_VALUE
     
     def evaluate_unary_op(self, node: UnaryOp) -> SoorjValue:
         """Evaluate unary operations"""
@@ -346,14 +417,28 @@ class Interpreter:
                 raise RuntimeError("Invalid operand for unary -")
         
         elif node.operator in ["չի", "not"]:  # չի (not)
-            return SoorjValue(not operand.is_truthy(), "boolean")
+            return FALSE_VALUE if operand.is_truthy() else TRUE_VALUE
         
         else:
             raise RuntimeError(f"Unknown unary operator: {node.operator}")
     
     def evaluate_function_call(self, node: FunctionCall) -> SoorjValue:
         """Evaluate function calls"""
-        function_value = self.environment.get(node.name)
+        environment = self.environment
+        if node.name in environment.variables:
+            # Frame-local binding: already a single dict hit, and unsafe to
+            # cache on the node since it differs per call frame
+            function_value = environment.variables[node.name]
+        else:
+            # Global binding: fixed once declared, so cache the resolution
+            # on the call site until a function binding changes
+            globals_env = environment.globals_env
+            function_value = node._resolved
+            if (function_value is None or
+                    node._resolved_version != globals_env.version):
+                function_value = environment.get(node.name)
+                node._resolved = function_value
+                node._resolved_version = globals_env.version
         
         if function_value.type_name != "function":
             raise RuntimeError(f"'{node.name}' is not a function")
@@ -1,8 +1,13 @@
-from enum import Enum, auto
-from typing import List, NamedTuple, Optional
+import re
+from enum import Enum, IntEnum, auto
+from typing import Any, List
 
 
-class TokenType(Enum):
+class TokenType(IntEnum):
+    # Members compare as raw C-level ints; keep Enum's str so error
+    # messages still read "TokenType.EOF" rather than a bare number
+    __str__ = Enum.__str__
+
     # Literals
     NUMBER = auto()
     STRING = auto()
@@ -47,98 +52,110 @@ class TokenType(Enum):
     EOF = auto()
 
 
-class Token(NamedTuple):
-    type: TokenType
-    value: str
-    line: int
-    column: int
+class TokenStream:
+    """Columnar token storage: four parallel lists indexed together.
+
+    Token types are stored as plain ints (TokenType.value) so the parser
+    compares integers instead of touching enum objects per token. The
+    value column holds the lexeme string, except for NUMBER tokens where
+    it holds the pre-parsed float.
+    """
+    __slots__ = ('types', 'values', 'lines', 'cols')
+
+    def __init__(self):
+        self.types: List[int] = []
+        self.values: List[Any] = []
+        self.lines: List[int] = []
+        self.cols: List[int] = []
+
+    def append(self, token_type: int, value: Any, line: int, column: int):
+        self.types.append(token_type)
+        self.values.append(value)
+        self.lines.append(line)
+        self.cols.append(column)
+
+    def __len__(self) -> int:
+        return len(self.types)
+
+
+# One pass over the source; the SRE engine does the per-character work in C.
+# Exactly one named group matches per token, so m.lastgroup names its kind.
+_TOKEN_RE = re.compile(
+    r"(?P<NUMBER>\d+(?:\.\d*)?)"  # trailing-dot literals (3.) stay valid
+    r"|(?P<IDENT>[\u0530-\u058F\uFB13-\uFB17]+)"
+    r"|(?P<STRING>\"(?:\\.|[^\"\\])*\"?|'(?:\\.|[^'\\])*'?)"
+    r"|(?P<OP>==|!=|<=|>=|[+\-*/%(){},=<>])"
+    r"|(?P<NL>\n)"
+    r"|(?P<WS>[ \t\r]+)"
+    r"|(?P<COMMENT>#[^\n]*)",
+    re.DOTALL,
+)
+
+
+# Whole-body whitelist for string literals: the Armenian blocks, digits,
+# whitespace, and common punctuation - one fullmatch replaces a Python
+# loop of is_valid_string_char calls
+_STRING_BODY_RE = re.compile(
+    r"[\u0530-\u058F\uFB13-\uFB17"
+    r"\d \t\n\r.,!?:;\-()\[\]{}\"'/\\]*"
+)
+
+
+# Every codepoint in the Armenian Unicode blocks:
+# U+0530-U+058F: Armenian
+# U+FB13-U+FB17: Armenian ligatures
+ARMENIAN_CHARS = frozenset(
+    chr(code_point)
+    for code_point in (*range(0x0530, 0x0590), *range(0xFB13, 0xFB18))
+)
 
 
 class Lexer:
     def __init__(self, source: str):
         self.source = source
-        self.position = 0
-        self.line = 1
-        self.column = 1
-        self.tokens = []
+        self.tokens = TokenStream()
         
         # Armenian keywords mapping
         self.keywords = {
-            'եթե': TokenType.IF,        # if
-            'հպ': TokenType.ELSE,       # else (short for հակառակ պարագային)
-            'մինչև': TokenType.WHILE,   # while
-            'գործ': TokenType.FUNCTION, # function (work)
-            'տուր': TokenType.RETURN,   # return (give)
-            'այո': TokenType.TRUE,      # true (yes)
-            'ոչ': TokenType.FALSE,      # false (no)
-            'հեչ': TokenType.NULL,      # null (nothing)
-            'և': TokenType.AND,         # and
-            'կամ': TokenType.OR,        # or
-            'չի': TokenType.NOT,        # not
-        }
-        
-        # Single character tokens
-        self.single_chars = {
-            '+': TokenType.PLUS,
-            '-': TokenType.MINUS,
-            '*': TokenType.MULTIPLY,
-            '/': TokenType.DIVIDE,
-            '%': TokenType.MODULO,
-            '(': TokenType.LEFT_PAREN,
-            ')': TokenType.RIGHT_PAREN,
-            '{': TokenType.LEFT_BRACE,
-            '}': TokenType.RIGHT_BRACE,
-            ',': TokenType.COMMA,
+            'եթե': TokenType.IF.value,        # if
+            'հպ': TokenType.ELSE.value,       # else (short for հակառակ պարագային)
+            'մինչև': TokenType.WHILE.value,   # while
+            'գործ': TokenType.FUNCTION.value, # function (work)
+            'տուր': TokenType.RETURN.value,   # return (give)
+            'այո': TokenType.TRUE.value,      # true (yes)
+            'ոչ': TokenType.FALSE.value,      # false (no)
+            'հեչ': TokenType.NULL.value,      # null (nothing)
+            'և': TokenType.AND.value,         # and
+            'կամ': TokenType.OR.value,        # or
+            'չի': TokenType.NOT.value,        # not
         }
         
-        # Two character tokens
-        self.two_chars = {
-            '==': TokenType.EQUALS,
-            '!=': TokenType.NOT_EQUALS,
-            '<=': TokenType.LESS_EQUAL,
-            '>=': TokenType.GREATER_EQUAL,
+        # Operator and delimiter lexemes, one- and two-character alike,
+        # resolved with a single dict probe
+        self.operators = {
+            '+': TokenType.PLUS.value,
+            '-': TokenType.MINUS.value,
+            '*': TokenType.MULTIPLY.value,
+            '/': TokenType.DIVIDE.value,
+            '%': TokenType.MODULO.value,
+            '(': TokenType.LEFT_PAREN.value,
+            ')': TokenType.RIGHT_PAREN.value,
+            '{': TokenType.LEFT_BRACE.value,
+            '}': TokenType.RIGHT_BRACE.value,
+            ',': TokenType.COMMA.value,
+            '=': TokenType.ASSIGN.value,
+            '<': TokenType.LESS_THAN.value,
+            '>': TokenType.GREATER_THAN.value,
+            '==': TokenType.EQUALS.value,
+            '!=': TokenType.NOT_EQUALS.value,
+            '<=': TokenType.LESS_EQUAL.value,
+            '>=': TokenType.GREATER_EQUAL.value,
         }
-    
-    def current_char(self) -> Optional[str]:
-        if self.position >= len(self.source):
-            return None
-        return self.source[self.position]
-    
-    def peek_char(self, offset: int = 1) -> Optional[str]:
-        peek_pos = self.position + offset
-        if peek_pos >= len(self.source):
-            return None
-        return self.source[peek_pos]
-    
-    def advance(self):
-        if self.position < len(self.source):
-            if self.source[self.position] == '\n':
-                self.line += 1
-                self.column = 1
-            else:
-                self.column += 1
-            self.position += 1
-    
-    def skip_whitespace(self):
-        while self.current_char() and self.current_char() in ' \t\r':
-            self.advance()
-    
+
     def is_armenian_char(self, char: str) -> bool:
         """Check if character is Armenian Unicode"""
-        if not char:
-            return False
-        code_point = ord(char)
-        # Armenian Unicode blocks:
-        # U+0530-U+058F: Armenian
-        # U+FB13-U+FB17: Armenian ligatures
-        return (0x0530 <= code_point <= 0x058F) or (0xFB13 <= code_point <= 0xFB17)
-    
-    def is_identifier_char(self, char: str) -> bool:
-        """Check if character can be part of an identifier - Armenian only"""
-        if not char:
-            return False
-        return self.is_armenian_char(char)
-    
+        return char in ARMENIAN_CHARS
+
     def is_valid_string_char(self, char: str) -> bool:
         """Check if character is valid in string literals"""
         if not char:
@@ -149,141 +166,127 @@ class Lexer:
                 char in ' \t\n\r.,!?:;-()[]{}"\'/\\' or
                 char in '՛՜՝՞՟։՚՛՜՝՞՟')  # Armenian punctuation
     
-    def read_number(self) -> Token:
-        start_column = self.column
-        number_str = ""
-        
-        while self.current_char() and (self.current_char().isdigit() or self.current_char() == '.'):
-            number_str += self.current_char()
-            self.advance()
-        
-        return Token(TokenType.NUMBER, number_str, self.line, start_column)
-    
-    def read_string(self) -> Token:
-        start_column = self.column
-        quote_char = self.current_char()
-        self.advance()  # Skip opening quote
-        
-        string_value = ""
-        while self.current_char() and self.current_char() != quote_char:
-            char = self.current_char()
+    def validate_string_body(self, body: str, line: int, column: int) -> None:
+        """Check that every character is allowed in string literals"""
+        if _STRING_BODY_RE.fullmatch(body):
+            return
+        # Walk the body only to locate the offending character
+        for char in body:
+            if not self.is_valid_string_char(char):
+                raise ValueError(
+                    f"Invalid character '{char}' in string at line {line}, "
+                    f"column {column}. Only Armenian characters, numbers, "
+                    f"and punctuation allowed."
+                )
+            if char == '\n':
+                line += 1
+                column = 1
+            else:
+                column += 1
+
+    def decode_string(self, body: str, quote_char: str,
+                      line: int, column: int) -> str:
+        """Validate a string body and decode its backslash escapes"""
+        if '\\' not in body:
+            # Common case: no escapes, so the matched slice is the value
+            self.validate_string_body(body, line, column + 1)
+            return body
+        parts = []
+        append = parts.append
+        pos = 0
+        column += 1  # past the opening quote
+        while pos < len(body):
+            char = body[pos]
             if char == '\\':
-                self.advance()
-                next_char = self.current_char()
+                pos += 1
+                column += 1
+                next_char = body[pos] if pos < len(body) else None
                 if next_char == 'n':
-                    string_value += '\n'
+                    append('\n')
                 elif next_char == 't':
-                    string_value += '\t'
+                    append('\t')
                 elif next_char == 'r':
-                    string_value += '\r'
+                    append('\r')
                 elif next_char == '\\':
-                    string_value += '\\'
+                    append('\\')
                 elif next_char == quote_char:
-                    string_value += quote_char
+                    append(quote_char)
                 elif next_char:
-                    string_value += next_char
-                self.advance()
+                    append(next_char)
+                pos += 1
+                column += 1
             else:
                 # Validate that character is allowed in strings
                 if not self.is_valid_string_char(char):
                     raise ValueError(
-                        f"Invalid character '{char}' in string at line {self.line}, "
-                        f"column {self.column}. Only Armenian characters, numbers, "
+                        f"Invalid character '{char}' in string at line {line}, "
+                        f"column {column}. Only Armenian characters, numbers, "
                         f"and punctuation allowed."
                     )
-                string_value += char
-                self.advance()
-        
-        if self.current_char() == quote_char:
-            self.advance()  # Skip closing quote
-        
-        return Token(TokenType.STRING, string_value, self.line, start_column)
-    
-    def read_identifier(self) -> Token:
-        start_column = self.column
-        identifier = ""
-        
-        while self.current_char() and self.is_identifier_char(self.current_char()):
-            identifier += self.current_char()
-            self.advance()
-        
-        # Check if it's a keyword
-        token_type = self.keywords.get(identifier, TokenType.IDENTIFIER)
-        return Token(token_type, identifier, self.line, start_column)
-    
-    def tokenize(self) -> List[Token]:
-        while self.position < len(self.source):
-            self.skip_whitespace()
-            
-            if not self.current_char():
-                break
-            
-            char = self.current_char()
-            
-            # Handle newlines
-            if char == '\n':
-                self.tokens.append(Token(TokenType.NEWLINE, char, self.line, self.column))
-                self.advance()
-                continue
-            
-            # Handle comments
-            if char == '#':
-                # Skip until end of line
-                while self.current_char() and self.current_char() != '\n':
-                    self.advance()
-                continue
-            
-            # Handle numbers
-            if char.isdigit():
-                self.tokens.append(self.read_number())
-                continue
-            
-            # Handle strings
-            if char in '"\'':
-                self.tokens.append(self.read_string())
-                continue
-            
-            # Handle identifiers and keywords (Armenian characters only)
-            if self.is_armenian_char(char):
-                self.tokens.append(self.read_identifier())
-                continue
-            
-            # Handle two-character operators
-            if char in '=!<>':
-                next_char = self.peek_char()
-                two_char = char + (next_char or '')
-                if two_char in self.two_chars:
-                    self.tokens.append(Token(self.two_chars[two_char], two_char, self.line, self.column))
-                    self.advance()
-                    self.advance()
-                    continue
-            
-            # Handle single character tokens
-            if char in self.single_chars:
-                self.tokens.append(Token(self.single_chars[char], char, self.line, self.column))
-                self.advance()
-                continue
-            
-            # Handle assignment operator
-            if char == '=':
-                self.tokens.append(Token(TokenType.ASSIGN, char, self.line, self.column))
-                self.advance()
-                continue
-            
-            # Handle comparison operators
-            if char == '<':
-                self.tokens.append(Token(TokenType.LESS_THAN, char, self.line, self.column))
-                self.advance()
-                continue
-            
-            if char == '>':
-                self.tokens.append(Token(TokenType.GREATER_THAN, char, self.line, self.column))
-                self.advance()
+                if char == '\n':
+                    line += 1
+                    column = 1
+                else:
+                    column += 1
+                append(char)
+                pos += 1
+        return "".join(parts)
+
+    def tokenize(self) -> TokenStream:
+        source = self.source
+        tokens = self.tokens
+        # Hoist every per-token attribute lookup out of the match loop
+        append = tokens.append
+        keyword_type = self.keywords.get
+        operator_type = self.operators.get
+        decode_string = self.decode_string
+        identifier_t = TokenType.IDENTIFIER.value
+        number_t = TokenType.NUMBER.value
+        string_t = TokenType.STRING.value
+        newline_t = TokenType.NEWLINE.value
+        line = 1
+        line_start = 0  # offset of the first character of the current line
+        pos = 0
+        for match in _TOKEN_RE.finditer(source):
+            start = match.start()
+            if start != pos:
+                raise ValueError(
+                    f"Unknown character '{source[pos]}' at line {line}, "
+                    f"column {pos - line_start + 1}"
+                )
+            kind = match.lastgroup
+            pos = match.end()
+            if kind == 'WS' or kind == 'COMMENT':
                 continue
-            
-            # If we get here, it's an unknown character
-            raise ValueError(f"Unknown character '{char}' at line {self.line}, column {self.column}")
-        
-        # Add EOF token
-        self.tokens.append(Token(TokenType.EOF, '', self.line, self.column))
-        return self.tokens 
\ No newline at end of file
+            column = start - line_start + 1
+            value = match.group()
+            if kind == 'IDENT':
+                append(keyword_type(value, identifier_t), value, line, column)
+            elif kind == 'NUMBER':
+                # Parse the numeric lexeme once, here, instead of per use
+                append(number_t, float(value), line, column)
+            elif kind == 'OP':
+                append(operator_type(value), value, line, column)
+            elif kind == 'STRING':
+                quote_char = value[0]
+                if len(value) > 1 and value[-1] == quote_char:
+                    body = value[1:-1]
+                else:
+                    body = value[1:]  # unterminated string, read to EOF
+                append(string_t, decode_string(body, quote_char, line, column),
+                       line, column)
+                newlines = value.count('\n')
+                if newlines:
+                    line += newlines
+                    line_start = start + value.rfind('\n') + 1
+            else:  # NL
+                append(newline_t, value, line, column)
+                line += 1
+                line_start = pos
+        if pos != len(source):
+            raise ValueError(
+                f"Unknown character '{source[pos]}' at line {line}, "
+                f"column {pos - line_start + 1}"
+            )
+        append(TokenType.EOF.value, '', line, len(source) - line_start + 1)
+        return tokens
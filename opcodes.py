@@ -0,0 +1,92 @@
+# Integer opcodes for the Soorj bytecode VM.
+# Each opcode is a plain int so the VM dispatch loop compares raw integers.
+
+# Stack manipulation
+LOAD_CONST = 0     # push consts[arg]
+LOAD_LOCAL = 1     # push locals[arg]
+STORE_LOCAL = 2    # pop into locals[arg]
+LOAD_GLOBAL = 25   # push globals[arg]
+STORE_GLOBAL = 26  # pop into globals[arg]
+POP = 3            # discard top of stack
+DUP = 4            # duplicate top of stack
+
+# Arithmetic
+ADD = 5
+SUB = 6
+MUL = 7
+DIV = 8
+MOD = 9
+NEG = 10
+
+# Comparison
+EQ = 11
+NE = 12
+LT = 13
+GT = 14
+LE = 15
+GE = 16
+
+# Logical
+BOOL_AND = 17
+BOOL_OR = 18
+BOOL_NOT = 19
+
+# Control flow
+JUMP = 20           # pc = arg
+JUMP_IF_FALSE = 21  # pop; if falsy, pc = arg
+CALL = 22           # call stacked callee with arg1 args; arg2 names it for errors
+RET = 23            # pop and return from the current frame
+
+# Built-ins
+PRINT = 24          # print arg stack values, push null
+
+# Numeric-specialized variants, emitted when the compiler can prove both
+# operands are numbers; handlers skip type checks and wrapper objects
+ADD_NUM = 27
+SUB_NUM = 28
+MUL_NUM = 29
+DIV_NUM = 30
+MOD_NUM = 31
+LT_NUM = 32
+GT_NUM = 33
+LE_NUM = 34
+GE_NUM = 35
+
+# Superinstructions fused by the compiler's peephole pass
+LT_LOCAL_CONST_JF = 36   # if not locals[arg1] < consts[arg2]: pc = arg3
+LT_GLOBAL_CONST_JF = 37  # if not globals[arg1] < consts[arg2]: pc = arg3
+INC_LOCAL = 38           # locals[arg] += 1
+INC_GLOBAL = 39          # globals[arg] += 1
+
+# Whole-loop escape hatch: run natives[arg] against the frame's slot list
+RUN_NATIVE = 40
+
+# Sentinel for a variable slot that has never been written; shared by the
+# VM's load handlers and the compiler's native-loop entry guards
+UNDEFINED = object()
+
+# Operand count per opcode, for decoding flat code back into instructions
+ARITY = {
+    LOAD_CONST: 1,
+    LOAD_LOCAL: 1,
+    STORE_LOCAL: 1,
+    LOAD_GLOBAL: 1,
+    STORE_GLOBAL: 1,
+    JUMP: 1,
+    JUMP_IF_FALSE: 1,
+    CALL: 2,
+    PRINT: 1,
+    LT_LOCAL_CONST_JF: 3,
+    LT_GLOBAL_CONST_JF: 3,
+    INC_LOCAL: 1,
+    INC_GLOBAL: 1,
+    RUN_NATIVE: 1,
+}
+
+# Operand positions that hold jump targets, per opcode
+JUMP_OPERANDS = {
+    JUMP: 0,
+    JUMP_IF_FALSE: 0,
+    LT_LOCAL_CONST_JF: 2,
+    LT_GLOBAL_CONST_JF: 2,
+}
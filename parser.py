@@ -1,346 +1,445 @@
 from typing import List, Optional
-from lexer import Token, TokenType
-from dataclasses import dataclass
-from abc import ABC
+from lexer import TokenStream, TokenType
+from dataclasses import dataclass, field
+
+
+# Integer node-kind tags, one per AST class; comparing node.kind is a
+# class-attribute int read, much cheaper than isinstance in hot paths
+KIND_NUMBER = 1
+KIND_STRING = 2
+KIND_BOOLEAN = 3
+KIND_NULL = 4
+KIND_IDENTIFIER = 5
+KIND_BINARY_OP = 6
+KIND_UNARY_OP = 7
+KIND_ASSIGNMENT = 8
+KIND_FUNCTION_CALL = 9
+KIND_EXPRESSION_STATEMENT = 10
+KIND_IF = 11
+KIND_WHILE = 12
+KIND_RETURN = 13
+KIND_FUNCTION_DECLARATION = 14
+KIND_PROGRAM = 15
 
 
 # AST Node base class
-class ASTNode(ABC):
-    pass
+class ASTNode:
+    # Empty slots so subclasses declaring slots=True actually shed
+    # their per-instance __dict__
+    __slots__ = ()
+    kind = 0
 
 
 # Expression nodes
-@dataclass
+@dataclass(slots=True)
 class NumberLiteral(ASTNode):
+    kind = KIND_NUMBER
     value: float
+    # Interpreter's cached wrapper for this literal, filled on first use
+    _soorj_value: object = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class StringLiteral(ASTNode):
+    kind = KIND_STRING
     value: str
+    _soorj_value: object = field(default=None, repr=False, compare=False)
 
 
-@dataclass
+@dataclass(slots=True)
 class BooleanLiteral(ASTNode):
+    kind = KIND_BOOLEAN
     value: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class NullLiteral(ASTNode):
+    kind = KIND_NULL
     pass
 
 
-@dataclass
+# NullLiteral carries no state, so one instance serves every null token
+NULL_LITERAL = NullLiteral()
+
+
+# Shared literal nodes: booleans and small whole numbers recur constantly,
+# and downstream code never mutates a literal's value. The lexer emits no
+# sign with NUMBER tokens, so only non-negative entries are needed.
+TRUE_LITERAL = BooleanLiteral(True)
+FALSE_LITERAL = BooleanLiteral(False)
+_SMALL_NUMBERS = {i: NumberLiteral(float(i)) for i in range(257)}
+
+
+@dataclass(slots=True)
 class Identifier(ASTNode):
+    kind = KIND_IDENTIFIER
     name: str
 
 
-@dataclass
+@dataclass(slots=True)
 class BinaryOp(ASTNode):
+    kind = KIND_BINARY_OP
     left: ASTNode
     operator: str
     right: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class UnaryOp(ASTNode):
+    kind = KIND_UNARY_OP
     operator: str
     operand: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class Assignment(ASTNode):
+    kind = KIND_ASSIGNMENT
     target: str
     value: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionCall(ASTNode):
+    kind = KIND_FUNCTION_CALL
     name: str
     arguments: List[ASTNode]
+    # Interpreter's cached callee resolution, keyed by environment version
+    _resolved: object = field(default=None, repr=False, compare=False)
+    _resolved_version: int = field(default=-1, repr=False, compare=False)
 
 
 # Statement nodes
-@dataclass
+@dataclass(slots=True)
 class ExpressionStatement(ASTNode):
+    kind = KIND_EXPRESSION_STATEMENT
     expression: ASTNode
 
 
-@dataclass
+@dataclass(slots=True)
 class IfStatement(ASTNode):
+    kind = KIND_IF
     condition: ASTNode
     then_branch: List[ASTNode]
     else_branch: Optional[List[ASTNode]] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class WhileStatement(ASTNode):
+    kind = KIND_WHILE
     condition: ASTNode
     body: List[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class ReturnStatement(ASTNode):
+    kind = KIND_RETURN
     value: Optional[ASTNode] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class FunctionDeclaration(ASTNode):
+    kind = KIND_FUNCTION_DECLARATION
     name: str
     parameters: List[str]
     body: List[ASTNode]
 
 
-@dataclass
+@dataclass(slots=True)
 class Program(ASTNode):
+    kind = KIND_PROGRAM
     statements: List[ASTNode]
 
 
+# Integer token types (TokenType.value), so the parser's hot compares are
+# int == int on the columnar arrays rather than enum attribute lookups
+NUMBER = TokenType.NUMBER.value
+STRING = TokenType.STRING.value
+IDENTIFIER = TokenType.IDENTIFIER.value
+IF = TokenType.IF.value
+ELSE = TokenType.ELSE.value
+WHILE = TokenType.WHILE.value
+FUNCTION = TokenType.FUNCTION.value
+RETURN = TokenType.RETURN.value
+TRUE = TokenType.TRUE.value
+FALSE = TokenType.FALSE.value
+NULL = TokenType.NULL.value
+AND = TokenType.AND.value
+OR = TokenType.OR.value
+NOT = TokenType.NOT.value
+PLUS = TokenType.PLUS.value
+MINUS = TokenType.MINUS.value
+MULTIPLY = TokenType.MULTIPLY.value
+DIVIDE = TokenType.DIVIDE.value
+MODULO = TokenType.MODULO.value
+ASSIGN = TokenType.ASSIGN.value
+EQUALS = TokenType.EQUALS.value
+NOT_EQUALS = TokenType.NOT_EQUALS.value
+LESS_THAN = TokenType.LESS_THAN.value
+GREATER_THAN = TokenType.GREATER_THAN.value
+LESS_EQUAL = TokenType.LESS_EQUAL.value
+GREATER_EQUAL = TokenType.GREATER_EQUAL.value
+LEFT_PAREN = TokenType.LEFT_PAREN.value
+RIGHT_PAREN = TokenType.RIGHT_PAREN.value
+LEFT_BRACE = TokenType.LEFT_BRACE.value
+RIGHT_BRACE = TokenType.RIGHT_BRACE.value
+COMMA = TokenType.COMMA.value
+NEWLINE = TokenType.NEWLINE.value
+EOF = TokenType.EOF.value
+
+# (left, right) binding powers per infix operator. Left-associative
+# operators have right = left + 1; assignment reverses them so it
+# nests to the right
+INFIX_BP = {
+    ASSIGN: (2, 1),
+    OR: (3, 4),
+    AND: (5, 6),
+    EQUALS: (7, 8),
+    NOT_EQUALS: (7, 8),
+    LESS_THAN: (9, 10),
+    GREATER_THAN: (9, 10),
+    LESS_EQUAL: (9, 10),
+    GREATER_EQUAL: (9, 10),
+    PLUS: (11, 12),
+    MINUS: (11, 12),
+    MULTIPLY: (13, 14),
+    DIVIDE: (13, 14),
+    MODULO: (13, 14),
+}
+
+# Token types that can start a prefix (unary) expression
+PREFIX_OPS = frozenset({NOT, MINUS})
+
+
 class Parser:
-    def __init__(self, tokens: List[Token]):
+    def __init__(self, tokens: TokenStream):
         self.tokens = tokens
+        self.types = tokens.types
+        self.values = tokens.values
+        self.lines = tokens.lines
         self.current = 0
+        # Keyword statements resolve with one dict probe on the token
+        # type; anything else falls through to expression_statement
+        self._stmt_dispatch = {
+            IF: self.if_statement,
+            WHILE: self.while_statement,
+            RETURN: self.return_statement,
+            FUNCTION: self.function_declaration,
+        }
     
     def is_at_end(self) -> bool:
-        return self.peek().type == TokenType.EOF
-    
-    def peek(self) -> Token:
-        return self.tokens[self.current]
+        return self.types[self.current] == EOF
     
-    def previous(self) -> Token:
-        return self.tokens[self.current - 1]
+    def check(self, token_type: int) -> bool:
+        return self.types[self.current] == token_type
     
-    def advance(self) -> Token:
-        if not self.is_at_end():
+    def match(self, token_type: int) -> bool:
+        if self.types[self.current] == token_type:
             self.current += 1
-        return self.previous()
-    
-    def check(self, token_type: TokenType) -> bool:
-        if self.is_at_end():
-            return False
-        return self.peek().type == token_type
-    
-    def match(self, *token_types: TokenType) -> bool:
-        for token_type in token_types:
-            if self.check(token_type):
-                self.advance()
-                return True
+            return True
         return False
     
-    def consume(self, token_type: TokenType, message: str) -> Token:
-        if self.check(token_type):
-            return self.advance()
+    def consume(self, token_type: int, message: str) -> str:
+        current = self.current
+        if self.types[current] == token_type:
+            self.current = current + 1
+            return self.values[current]
         
-        current_token = self.peek()
         raise SyntaxError(
-            f"{message}. Got {current_token.type} at line {current_token.line}"
+            f"{message}. Got {TokenType(self.types[current])} "
+            f"at line {self.lines[current]}"
         )
     
-    def skip_newlines(self):
-        while self.match(TokenType.NEWLINE):
-            pass
-    
     def parse(self) -> Program:
-        statements = []
-        
-        while not self.is_at_end():
-            self.skip_newlines()
-            if not self.is_at_end():
-                stmt = self.statement()
+        types = self.types
+        # Cheap statement-count estimate: a quarter of the non-newline
+        # tokens. Pre-sizing skips the power-of-two list regrowth that
+        # append churn causes on large programs.
+        approx = (len(types) - types.count(NEWLINE)) >> 2
+        statements = [None] * approx
+        count = 0
+        dispatch = self._stmt_dispatch.get
+        expression_statement = self.expression_statement
+
+        while types[self.current] != EOF:
+            while types[self.current] == NEWLINE:
+                self.current += 1
+            token_type = types[self.current]
+            if token_type != EOF:
+                # Dispatch inline: most lines are expression statements,
+                # and the statement() trampoline is two frames of pure
+                # overhead on a large flat program
+                handler = dispatch(token_type)
+                if handler is not None:
+                    self.current += 1
+                    stmt = handler()
+                elif token_type == RIGHT_BRACE:
+                    stmt = None
+                else:
+                    stmt = expression_statement()
                 if stmt:
-                    statements.append(stmt)
+                    if count < approx:
+                        statements[count] = stmt
+                    else:
+                        statements.append(stmt)
+                    count += 1
         
+        del statements[count:]
         return Program(statements)
     
     def statement(self) -> Optional[ASTNode]:
-        self.skip_newlines()
-        
-        if self.match(TokenType.IF):
-            return self.if_statement()
-        if self.match(TokenType.WHILE):
-            return self.while_statement()
-        if self.match(TokenType.RETURN):
-            return self.return_statement()
-        if self.match(TokenType.FUNCTION):
-            return self.function_declaration()
-        
+        types = self.types
+        while types[self.current] == NEWLINE:
+            self.current += 1
+
+        token_type = types[self.current]
+        handler = self._stmt_dispatch.get(token_type)
+        if handler is not None:
+            self.current += 1  # consume the keyword
+            return handler()
+
         # Check if we're at a token that can't start a statement
-        if self.check(TokenType.RIGHT_BRACE) or self.check(TokenType.EOF):
+        if token_type == RIGHT_BRACE or token_type == EOF:
             return None
-        
+
         return self.expression_statement()
     
+    def _parse_block(self, body: List[ASTNode]) -> None:
+        """Parse statements into body until the closing brace (or EOF)"""
+        types = self.types
+        while True:
+            token_type = types[self.current]
+            if token_type == RIGHT_BRACE or token_type == EOF:
+                return
+            stmt = self.statement()
+            if stmt:
+                body.append(stmt)
+    
     def if_statement(self) -> IfStatement:
+        types = self.types
         condition = self.expression()
-        self.skip_newlines()
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
         # Expect opening brace
-        self.consume(TokenType.LEFT_BRACE, "Expected '{' after if condition")
-        self.skip_newlines()
+        self.consume(LEFT_BRACE, "Expected '{' after if condition")
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
         then_branch = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            stmt = self.statement()
-            if stmt:
-                then_branch.append(stmt)
+        self._parse_block(then_branch)
         
-        self.consume(TokenType.RIGHT_BRACE, "Expected '}' after if body")
+        self.consume(RIGHT_BRACE, "Expected '}' after if body")
         
         else_branch = None
-        if self.match(TokenType.ELSE):
-            self.skip_newlines()
-            self.consume(TokenType.LEFT_BRACE, "Expected '{' after else")
-            self.skip_newlines()
+        if self.match(ELSE):
+            while types[self.current] == NEWLINE:
+                self.current += 1
+            self.consume(LEFT_BRACE, "Expected '{' after else")
+            while types[self.current] == NEWLINE:
+                self.current += 1
             
             else_branch = []
-            while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-                stmt = self.statement()
-                if stmt:
-                    else_branch.append(stmt)
+            self._parse_block(else_branch)
             
-            self.consume(TokenType.RIGHT_BRACE, "Expected '}' after else body")
+            self.consume(RIGHT_BRACE, "Expected '}' after else body")
         
         return IfStatement(condition, then_branch, else_branch)
     
     def while_statement(self) -> WhileStatement:
+        types = self.types
         condition = self.expression()
-        self.skip_newlines()
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
-        self.consume(TokenType.LEFT_BRACE, "Expected '{' after while condition")
-        self.skip_newlines()
+        self.consume(LEFT_BRACE, "Expected '{' after while condition")
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
         body = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            stmt = self.statement()
-            if stmt:
-                body.append(stmt)
+        self._parse_block(body)
         
-        self.consume(TokenType.RIGHT_BRACE, "Expected '}' after while body")
+        self.consume(RIGHT_BRACE, "Expected '}' after while body")
         return WhileStatement(condition, body)
     
     def return_statement(self) -> ReturnStatement:
         value = None
-        if (not self.check(TokenType.NEWLINE) and 
-                not self.is_at_end()):
+        token_type = self.types[self.current]
+        if token_type != NEWLINE and token_type != EOF:
             value = self.expression()
         
         return ReturnStatement(value)
     
     def function_declaration(self) -> FunctionDeclaration:
-        name = self.consume(TokenType.IDENTIFIER, 
-                            "Expected function name").value
+        name = self.consume(IDENTIFIER, "Expected function name")
         
-        self.consume(TokenType.LEFT_PAREN, 
+        self.consume(LEFT_PAREN, 
                      "Expected '(' after function name")
         
         parameters = []
-        if not self.check(TokenType.RIGHT_PAREN):
-            param_name = self.consume(TokenType.IDENTIFIER, 
-                                      "Expected parameter name").value
-            parameters.append(param_name)
-            while self.match(TokenType.COMMA):
-                param_name = self.consume(TokenType.IDENTIFIER, 
-                                          "Expected parameter name").value
-                parameters.append(param_name)
-        
-        self.consume(TokenType.RIGHT_PAREN, "Expected ')' after parameters")
-        self.skip_newlines()
+        if not self.check(RIGHT_PAREN):
+            parameters.append(
+                self.consume(IDENTIFIER, "Expected parameter name"))
+            while self.match(COMMA):
+                parameters.append(
+                    self.consume(IDENTIFIER, "Expected parameter name"))
+        
+        self.consume(RIGHT_PAREN, "Expected ')' after parameters")
+        types = self.types
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
-        self.consume(TokenType.LEFT_BRACE, "Expected '{' before function body")
-        self.skip_newlines()
+        self.consume(LEFT_BRACE, "Expected '{' before function body")
+        while types[self.current] == NEWLINE:
+            self.current += 1
         
         body = []
-        while not self.check(TokenType.RIGHT_BRACE) and not self.is_at_end():
-            stmt = self.statement()
-            if stmt:
-                body.append(stmt)
+        self._parse_block(body)
         
-        self.consume(TokenType.RIGHT_BRACE, "Expected '}' after function body")
+        self.consume(RIGHT_BRACE, "Expected '}' after function body")
         return FunctionDeclaration(name, parameters, body)
     
-    def expression_statement(self) -> ExpressionStatement:
+    def expression_statement(self) -> ASTNode:
         expr = self.expression()
+        kind = expr.kind
+        if kind == KIND_FUNCTION_CALL or kind == KIND_ASSIGNMENT:
+            # Already statement-like: calls and assignments are executed
+            # directly, so the wrapper node would just be unwrapped again
+            return expr
         return ExpressionStatement(expr)
     
     def expression(self) -> ASTNode:
-        return self.assignment()
-    
-    def assignment(self) -> ASTNode:
-        expr = self.logical_or()
-        
-        if self.match(TokenType.ASSIGN):
-            value = self.assignment()
-            if isinstance(expr, Identifier):
-                return Assignment(expr.name, value)
-            
-            raise SyntaxError("Invalid assignment target")
-        
-        return expr
+        return self.parse_expression(0)
     
-    def logical_or(self) -> ASTNode:
-        expr = self.logical_and()
-        
-        while self.match(TokenType.OR):
-            operator = self.previous().value
-            right = self.logical_and()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def logical_and(self) -> ASTNode:
-        expr = self.equality()
-        
-        while self.match(TokenType.AND):
-            operator = self.previous().value
-            right = self.equality()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def equality(self) -> ASTNode:
-        expr = self.comparison()
-        
-        while self.match(TokenType.EQUALS, TokenType.NOT_EQUALS):
-            operator = self.previous().value
-            right = self.comparison()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def comparison(self) -> ASTNode:
-        expr = self.term()
-        
-        while self.match(TokenType.GREATER_THAN, TokenType.GREATER_EQUAL, 
-                         TokenType.LESS_THAN, TokenType.LESS_EQUAL):
-            operator = self.previous().value
-            right = self.term()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def term(self) -> ASTNode:
-        expr = self.factor()
-        
-        while self.match(TokenType.PLUS, TokenType.MINUS):
-            operator = self.previous().value
-            right = self.factor()
-            expr = BinaryOp(expr, operator, right)
-        
-        return expr
-    
-    def factor(self) -> ASTNode:
-        expr = self.unary()
-        
-        while self.match(TokenType.MULTIPLY, TokenType.DIVIDE, TokenType.MODULO):
-            operator = self.previous().value
-            right = self.unary()
-            expr = BinaryOp(expr, operator, right)
+    def parse_expression(self, min_bp: int) -> ASTNode:
+        """Precedence-climbing loop over INFIX_BP.
+
+        One function replaces the assignment/logical_or/.../factor tier
+        chain, so a bare identifier costs one call instead of eight.
+        """
+        types = self.types
+        left = self.unary()
         
-        return expr
+        while True:
+            op_type = types[self.current]
+            bp = INFIX_BP.get(op_type)
+            if bp is None or bp[0] < min_bp:
+                return left
+            operator = self.values[self.current]
+            self.current += 1
+            right = self.parse_expression(bp[1])
+            if op_type == ASSIGN:
+                if left.kind == KIND_IDENTIFIER:
+                    left = Assignment(left.name, right)
+                else:
+                    raise SyntaxError("Invalid assignment target")
+            else:
+                left = BinaryOp(left, operator, right)
     
     def unary(self) -> ASTNode:
-        if self.match(TokenType.NOT, TokenType.MINUS):
-            operator = self.previous().value
+        current = self.current
+        if self.types[current] in PREFIX_OPS:
+            self.current = current + 1
+            operator = self.values[current]
             right = self.unary()
             return UnaryOp(operator, right)
         
@@ -350,7 +449,7 @@ class Parser:
         expr = self.primary()
         
         while True:
-            if self.match(TokenType.LEFT_PAREN):
+            if self.match(LEFT_PAREN):
                 expr = self.finish_call(expr)
             else:
                 break
@@ -360,41 +459,50 @@ class Parser:
     def finish_call(self, callee: ASTNode) -> FunctionCall:
         arguments = []
         
-        if not self.check(TokenType.RIGHT_PAREN):
+        if not self.check(RIGHT_PAREN):
             arguments.append(self.expression())
-            while self.match(TokenType.COMMA):
+            while self.match(COMMA):
                 arguments.append(self.expression())
         
-        self.consume(TokenType.RIGHT_PAREN, "Expected ')' after arguments")
+        self.consume(RIGHT_PAREN, "Expected ')' after arguments")
         
-        if isinstance(callee, Identifier):
+        if callee.kind == KIND_IDENTIFIER:
             return FunctionCall(callee.name, arguments)
         
         raise SyntaxError("Invalid function call")
     
     def primary(self) -> ASTNode:
-        if self.match(TokenType.TRUE):
-            return BooleanLiteral(True)
+        if self.match(TRUE):
+            return TRUE_LITERAL
         
-        if self.match(TokenType.FALSE):
-            return BooleanLiteral(False)
+        if self.match(FALSE):
+            return FALSE_LITERAL
         
-        if self.match(TokenType.NULL):
-            return NullLiteral()
+        if self.match(NULL):
+            return NULL_LITERAL
         
-        if self.match(TokenType.NUMBER):
-            return NumberLiteral(float(self.previous().value))
+        if self.match(NUMBER):
+            # The lexer already parsed the lexeme to a float
+            value = self.values[self.current - 1]
+            if value.is_integer():
+                node = _SMALL_NUMBERS.get(int(value))
+                if node is not None:
+                    return node
+            return NumberLiteral(value)
         
-        if self.match(TokenType.STRING):
-            return StringLiteral(self.previous().value)
+        if self.match(STRING):
+            return StringLiteral(self.values[self.current - 1])
         
-        if self.match(TokenType.IDENTIFIER):
-            return Identifier(self.previous().value)
+        if self.match(IDENTIFIER):
+            return Identifier(self.values[self.current - 1])
         
-        if self.match(TokenType.LEFT_PAREN):
+        if self.match(LEFT_PAREN):
             expr = self.expression()
-            self.consume(TokenType.RIGHT_PAREN, "Expected ')' after expression")
+            self.consume(RIGHT_PAREN, "Expected ')' after expression")
             return expr
         
-        current_token = self.peek()
-        raise SyntaxError(f"Unexpected token {current_token.type} at line {current_token.line}") 
\ No newline at end of file
+        current = self.current
+        raise SyntaxError(
+            f"Unexpected token {TokenType(self.types[current])} "
+            f"at line {self.lines[current]}"
+        ) 
\ No newline at end of file
@@ -6,9 +6,54 @@ A simple interpreter for an Armenian programming language
 
 import sys
 import os
+from functools import lru_cache
 from lexer import Lexer
-from parser import Parser
+from parser import (
+    Parser, Program,
+    KIND_EXPRESSION_STATEMENT, KIND_ASSIGNMENT, KIND_FUNCTION_CALL,
+)
+from compiler import Compiler, CodeObject
 from interpreter import Interpreter
+from vm import VM
+
+# Statement kinds whose lone-expression result the REPL echoes
+_ECHO_KINDS = frozenset({
+    KIND_EXPRESSION_STATEMENT, KIND_ASSIGNMENT, KIND_FUNCTION_CALL,
+})
+
+# One interpreter shared by every REPL entry so definitions persist
+# across lines (and across callers embedding the REPL)
+_INTERPRETER = Interpreter()
+
+
+@lru_cache(maxsize=256)
+def _parse(source: str) -> Program:
+    """Tokenize and parse source, memoized on the source text"""
+    return Parser(Lexer(source).tokenize()).parse()
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(source: str) -> CodeObject:
+    """Compile source to bytecode, memoized on the source text.
+
+    Re-running an identical program - test harnesses, replayed snippets -
+    skips the whole front end and goes straight to bytecode.
+    """
+    return Compiler().compile_program(_parse(source))
+
+
+def _execute(interpreter: Interpreter, program: Program,
+             print_last: bool = False) -> None:
+    """Run a program on the tree-walker, echoing a lone expression result"""
+    statements = program.statements
+    if (print_last and len(statements) == 1 and
+            statements[0].kind in _ECHO_KINDS):
+        result = interpreter.execute(statements[0])
+        if result is not None:
+            print(result)
+        return
+    for statement in statements:
+        interpreter.execute(statement)
 
 
 def run_file(filename: str) -> None:
@@ -28,18 +73,13 @@ def run_file(filename: str) -> None:
 def run_source(source: str) -> None:
     """Run Soorj source code"""
     try:
-        # Tokenize
-        lexer = Lexer(source)
-        tokens = lexer.tokenize()
-        
-        # Parse
-        parser = Parser(tokens)
-        ast = parser.parse()
-        
-        # Interpret
-        interpreter = Interpreter()
-        interpreter.interpret(ast)
-        
+        # Compile to bytecode (cached) and run on a fresh VM. The VM is
+        # not shared between programs: global slot numbering is
+        # per-program, so reusing one would alias unrelated variables.
+        code = _compile_cached(source)
+        vm = VM()
+        vm.interpret(code)
+
     except Exception as e:
         print(f"Error: {e}")
 
@@ -119,9 +159,45 @@ Example Soorj Programs:
 """)
 
 
+def _clear_screen():
+    os.system('clear' if os.name == 'posix' else 'cls')
+
+
+# REPL dot-commands: one dict probe instead of an elif chain per line.
+# .exit stays special-cased since it has to break the caller's loop.
+_CMDS = {
+    ".help": print_help,
+    ".example": print_example,
+    ".clear": _clear_screen,
+}
+
+
+def _run_line(interpreter: Interpreter, source: str) -> None:
+    """Execute one line of REPL input, echoing single-expression results"""
+    _execute(interpreter, _parse(source), print_last=True)
+
+
+def batch_repl(interpreter: Interpreter) -> None:
+    """Run piped REPL input line by line - no prompt, no readline"""
+    for line in sys.stdin:
+        source = line.strip()
+        if source == ".exit":
+            break
+        command = _CMDS.get(source)
+        if command is not None:
+            command()
+            continue
+        if source == "":
+            continue
+        try:
+            _run_line(interpreter, source)
+        except Exception as e:
+            print(f"Error: {e}")
+
+
 def repl():
     """Start the REPL"""
-    interpreter = Interpreter()
+    interpreter = _INTERPRETER
     
     print("Սուրճ (Soorj) Armenian Programming Language")
     print("Type .help for help, .exit to quit")
@@ -129,43 +205,22 @@ def repl():
     
     while True:
         try:
-            source = input("soorj> ")
+            source = input("soorj> ").strip()
             
             # Handle REPL commands
-            if source.strip() == ".exit":
+            if source == ".exit":
                 print("Ցտեսություն! (Goodbye!)")
                 break
-            elif source.strip() == ".help":
-                print_help()
-                continue
-            elif source.strip() == ".clear":
-                os.system('clear' if os.name == 'posix' else 'cls')
-                continue
-            elif source.strip() == ".example":
-                print_example()
+            command = _CMDS.get(source)
+            if command is not None:
+                command()
                 continue
-            elif source.strip() == "":
+            if source == "":
                 continue
             
             # Execute the source code
             try:
-                # Tokenize
-                lexer = Lexer(source)
-                tokens = lexer.tokenize()
-                
-                # Parse
-                parser = Parser(tokens)
-                ast = parser.parse()
-                
-                # Interpret
-                for statement in ast.statements:
-                    result = interpreter.execute(statement)
-                    # Print result for single expressions (like a calculator)
-                    if (result is not None and 
-                        hasattr(statement, 'expression') and
-                        len(ast.statements) == 1):
-                        print(result)
-                
+                _run_line(interpreter, source)
             except KeyboardInterrupt:
                 print("\nInterrupted")
                 continue
@@ -183,10 +238,19 @@ def repl():
 
 def main():
     """Main entry point"""
-    if len(sys.argv) > 1:
+    if len(sys.argv) > 2:
+        # Several files: fan out across worker processes, one Python
+        # startup amortized over each worker's share of the queue
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            list(executor.map(run_file, sys.argv[1:]))
+    elif len(sys.argv) > 1:
         # Run file
         filename = sys.argv[1]
         run_file(filename)
+    elif not sys.stdin.isatty():
+        # Piped input: line-buffered batch mode, no prompt or readline
+        batch_repl(_INTERPRETER)
     else:
         # Start REPL
         repl()
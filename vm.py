@@ -0,0 +1,633 @@
+from typing import Any, List
+from compiler import CodeObject, BUILTIN_NAMES
+import opcodes as op
+from opcodes import UNDEFINED
+
+
+def soorj_str(value: Any) -> str:
+    """Format a raw VM value the way Soorj prints it"""
+    if value is None:
+        return "հեչ"  # nothing
+    elif value is True:
+        return "այո"  # yes
+    elif value is False:
+        return "ոչ"   # no
+    else:
+        return str(value)
+
+
+def is_number(value: Any) -> bool:
+    """True for numeric values (booleans are not numbers in Soorj)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# Built-ins take the operand stack and an argument count, consume their
+# arguments in place, and push their result - no argument list is built.
+
+def builtin_tiv(stack: List[Any], arg_count: int) -> None:
+    """թիվ (number) - converts to number"""
+    if arg_count != 1:
+        raise RuntimeError("թիվ expects exactly 1 argument")
+
+    arg = stack[-1]
+    if is_number(arg):
+        return
+    elif isinstance(arg, str):
+        try:
+            stack[-1] = float(arg)
+        except ValueError:
+            stack[-1] = 0
+    elif isinstance(arg, bool):
+        stack[-1] = 1 if arg else 0
+    else:
+        stack[-1] = 0
+
+
+def builtin_bar(stack: List[Any], arg_count: int) -> None:
+    """բառ (word/string) - converts to string"""
+    if arg_count != 1:
+        raise RuntimeError("բառ expects exactly 1 argument")
+
+    arg = stack[-1]
+    if isinstance(arg, str):
+        return
+    elif arg is None:
+        stack[-1] = ""
+    else:
+        stack[-1] = str(arg)
+
+
+def builtin_gre(stack: List[Any], arg_count: int) -> None:
+    """գրէ (write/print) - Print values to console"""
+    if arg_count == 0:
+        print()
+        stack.append(None)
+        return
+    base = len(stack) - arg_count
+    print(" ".join(soorj_str(stack[i]) for i in range(base, len(stack))))
+    del stack[base:]
+    stack.append(None)
+
+
+BUILTIN_FUNCTIONS = {
+    "գրէ": builtin_gre,
+    "թիվ": builtin_tiv,
+    "բառ": builtin_bar,
+}
+
+
+class Frame:
+    """Execution state for one code object"""
+    __slots__ = ('vm', 'code_obj', 'code', 'consts', 'local_vars',
+                 'global_vars', 'stack', 'pc', 'return_value')
+
+    def __init__(self, vm: 'VM', code_obj: CodeObject, local_vars: List[Any]):
+        self.vm = vm
+        self.code_obj = code_obj
+        self.code = code_obj.code
+        self.consts = code_obj.consts
+        self.local_vars = local_vars
+        self.global_vars = vm.globals
+        self.stack: List[Any] = []
+        self.pc = 0
+        self.return_value: Any = None
+
+
+# Threaded-code handlers. Each handler executes one instruction with
+# frame.pc pointing at its first operand, then fetches the next opcode and
+# returns its handler - the driver loop is a single `h = h(frame)` step
+# with no per-instruction if/elif ladder. RET returns None to stop.
+
+def _undefined_local(frame, slot):
+    raise RuntimeError(
+        f"Undefined variable '{frame.code_obj.local_names[slot]}'"
+    )
+
+
+def _undefined_global(frame, slot):
+    raise RuntimeError(
+        f"Undefined variable '{frame.vm.global_names[slot]}'"
+    )
+
+
+def _op_load_const(frame):
+    code = frame.code
+    pc = frame.pc
+    frame.stack.append(frame.consts[code[pc]])
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_load_local(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.local_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_local(frame, code[pc])
+    frame.stack.append(value)
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_store_local(frame):
+    code = frame.code
+    pc = frame.pc
+    frame.local_vars[code[pc]] = frame.stack.pop()
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_load_global(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.global_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_global(frame, code[pc])
+    frame.stack.append(value)
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_store_global(frame):
+    code = frame.code
+    pc = frame.pc
+    frame.global_vars[code[pc]] = frame.stack.pop()
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_pop(frame):
+    frame.stack.pop()
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_dup(frame):
+    stack = frame.stack
+    stack.append(stack[-1])
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_add(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left + right)
+    elif isinstance(left, str) or isinstance(right, str):
+        stack.append(str(left) + str(right))
+    else:
+        raise RuntimeError("Invalid operands for +")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_sub(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left - right)
+    else:
+        raise RuntimeError("Invalid operands for -")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_mul(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left * right)
+    else:
+        raise RuntimeError("Invalid operands for *")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_div(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        if right == 0:
+            raise RuntimeError("Division by zero")
+        stack.append(left / right)
+    else:
+        raise RuntimeError("Invalid operands for /")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_mod(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left % right)
+    else:
+        raise RuntimeError("Invalid operands for %")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_neg(frame):
+    stack = frame.stack
+    value = stack.pop()
+    if is_number(value):
+        stack.append(-value)
+    else:
+        raise RuntimeError("Invalid operand for unary -")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_eq(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() == right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_ne(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() != right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_lt(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left < right)
+    else:
+        raise RuntimeError("Invalid operands for <")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_gt(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left > right)
+    else:
+        raise RuntimeError("Invalid operands for >")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_le(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left <= right)
+    else:
+        raise RuntimeError("Invalid operands for <=")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_ge(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    if is_number(left) and is_number(right):
+        stack.append(left >= right)
+    else:
+        raise RuntimeError("Invalid operands for >=")
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_bool_and(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    stack.append(bool(left) and bool(right))
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_bool_or(frame):
+    stack = frame.stack
+    right = stack.pop()
+    left = stack.pop()
+    stack.append(bool(left) or bool(right))
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_bool_not(frame):
+    stack = frame.stack
+    stack.append(not bool(stack.pop()))
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_add_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() + right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_sub_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() - right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_mul_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() * right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_div_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    if right == 0:
+        raise RuntimeError("Division by zero")
+    stack.append(stack.pop() / right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_mod_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() % right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_lt_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() < right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_gt_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() > right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_le_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() <= right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_ge_num(frame):
+    stack = frame.stack
+    right = stack.pop()
+    stack.append(stack.pop() >= right)
+    pc = frame.pc
+    frame.pc = pc + 1
+    return _HANDLERS[frame.code[pc]]
+
+
+def _op_lt_local_const_jf(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.local_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_local(frame, code[pc])
+    if value < frame.consts[code[pc + 1]]:
+        pc += 3
+    else:
+        pc = code[pc + 2]
+    frame.pc = pc + 1
+    return _HANDLERS[code[pc]]
+
+
+def _op_lt_global_const_jf(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.global_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_global(frame, code[pc])
+    if value < frame.consts[code[pc + 1]]:
+        pc += 3
+    else:
+        pc = code[pc + 2]
+    frame.pc = pc + 1
+    return _HANDLERS[code[pc]]
+
+
+def _op_inc_local(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.local_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_local(frame, code[pc])
+    frame.local_vars[code[pc]] = value + 1
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_inc_global(frame):
+    code = frame.code
+    pc = frame.pc
+    value = frame.global_vars[code[pc]]
+    if value is UNDEFINED:
+        _undefined_global(frame, code[pc])
+    frame.global_vars[code[pc]] = value + 1
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_jump(frame):
+    code = frame.code
+    pc = code[frame.pc]
+    frame.pc = pc + 1
+    return _HANDLERS[code[pc]]
+
+
+def _op_jump_if_false(frame):
+    code = frame.code
+    pc = frame.pc
+    if frame.stack.pop():
+        pc += 1
+    else:
+        pc = code[pc]
+    frame.pc = pc + 1
+    return _HANDLERS[code[pc]]
+
+
+def _op_call(frame):
+    code = frame.code
+    pc = frame.pc
+    arg_count = code[pc]
+    stack = frame.stack
+    callee_index = len(stack) - arg_count - 1
+    function = stack[callee_index]
+    if type(function) is CodeObject:
+        if arg_count != len(function.parameters):
+            raise RuntimeError(
+                f"Function {function.name} expects "
+                f"{len(function.parameters)} arguments, got {arg_count}"
+            )
+        # Read the arguments straight off the operand stack into the
+        # preallocated locals list
+        local_vars = [UNDEFINED] * function.num_locals
+        local_vars[:arg_count] = stack[callee_index + 1:]
+        del stack[callee_index:]
+        stack.append(frame.vm.run(function, local_vars))
+    elif callable(function):
+        del stack[callee_index]
+        function(stack, arg_count)
+    else:
+        raise RuntimeError(f"'{frame.consts[code[pc + 1]]}' is not a function")
+    frame.pc = pc + 3
+    return _HANDLERS[code[pc + 2]]
+
+
+def _op_ret(frame):
+    frame.return_value = frame.stack.pop()
+    return None
+
+
+def _op_print(frame):
+    code = frame.code
+    pc = frame.pc
+    builtin_gre(frame.stack, code[pc])
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+def _op_run_native(frame):
+    code = frame.code
+    pc = frame.pc
+    if frame.code_obj.global_names is not None:
+        storage = frame.global_vars
+    else:
+        storage = frame.local_vars
+    frame.code_obj.natives[code[pc]](storage)
+    frame.pc = pc + 2
+    return _HANDLERS[code[pc + 1]]
+
+
+# Tuple indexed by opcode int; tuple indexing beats a dict probe
+_HANDLER_TABLE = {
+    op.LOAD_CONST: _op_load_const,
+    op.LOAD_LOCAL: _op_load_local,
+    op.STORE_LOCAL: _op_store_local,
+    op.LOAD_GLOBAL: _op_load_global,
+    op.STORE_GLOBAL: _op_store_global,
+    op.POP: _op_pop,
+    op.DUP: _op_dup,
+    op.ADD: _op_add,
+    op.SUB: _op_sub,
+    op.MUL: _op_mul,
+    op.DIV: _op_div,
+    op.MOD: _op_mod,
+    op.NEG: _op_neg,
+    op.EQ: _op_eq,
+    op.NE: _op_ne,
+    op.LT: _op_lt,
+    op.GT: _op_gt,
+    op.LE: _op_le,
+    op.GE: _op_ge,
+    op.BOOL_AND: _op_bool_and,
+    op.BOOL_OR: _op_bool_or,
+    op.BOOL_NOT: _op_bool_not,
+    op.ADD_NUM: _op_add_num,
+    op.SUB_NUM: _op_sub_num,
+    op.MUL_NUM: _op_mul_num,
+    op.DIV_NUM: _op_div_num,
+    op.MOD_NUM: _op_mod_num,
+    op.LT_NUM: _op_lt_num,
+    op.GT_NUM: _op_gt_num,
+    op.LE_NUM: _op_le_num,
+    op.GE_NUM: _op_ge_num,
+    op.LT_LOCAL_CONST_JF: _op_lt_local_const_jf,
+    op.LT_GLOBAL_CONST_JF: _op_lt_global_const_jf,
+    op.INC_LOCAL: _op_inc_local,
+    op.INC_GLOBAL: _op_inc_global,
+    op.JUMP: _op_jump,
+    op.JUMP_IF_FALSE: _op_jump_if_false,
+    op.CALL: _op_call,
+    op.RET: _op_ret,
+    op.PRINT: _op_print,
+    op.RUN_NATIVE: _op_run_native,
+}
+
+_HANDLERS = tuple(
+    _HANDLER_TABLE.get(opcode) for opcode in range(max(_HANDLER_TABLE) + 1)
+)
+
+
+class VM:
+    """Stack machine that executes compiled Soorj bytecode"""
+    def __init__(self):
+        self.globals: List[Any] = [BUILTIN_FUNCTIONS[name] for name in BUILTIN_NAMES]
+        self.global_names: List[str] = list(BUILTIN_NAMES)
+
+    def interpret(self, code: CodeObject) -> None:
+        """Run a top-level code object"""
+        self.global_names = code.global_names
+        # Grow the flat global slot table to the compiled size
+        self.globals.extend([UNDEFINED] * (len(code.global_names) - len(self.globals)))
+        try:
+            self.run(code, [])
+        except RuntimeError as e:
+            print(f"Runtime error: {e}")
+
+    def run(self, code_obj: CodeObject, local_vars: List[Any]) -> Any:
+        """Threaded-dispatch driver: each handler hands back its successor"""
+        code = code_obj.code
+        if not code:
+            return None
+        frame = Frame(self, code_obj, local_vars)
+        frame.pc = 1
+        handler = _HANDLERS[code[0]]
+        while handler is not None:
+            handler = handler(frame)
+        return frame.return_value